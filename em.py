@@ -4,31 +4,34 @@ if os.environ.get("XDG_SESSION_TYPE", "").lower() == "wayland":
     os.environ["QT_QPA_PLATFORM"] = "xcb"
 
 import sys
+import json
+import fcntl
 import pickle
 import socket
+import struct
+import hashlib
+from collections import OrderedDict
 from datetime import datetime
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QMessageBox, QScrollArea, QFrame, QCheckBox,
     QTextEdit, QSizePolicy, QLineEdit, QCompleter
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer, QStringListModel
-from PySide6.QtGui import QFont, QPixmap
+from PySide6.QtCore import (
+    Qt, QThread, Signal, QTimer, QStringListModel, QObject, QRunnable, QThreadPool, QSocketNotifier
+)
+from PySide6.QtGui import QFont, QPixmap, QImage
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 import base64
 import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
-from openai import OpenAI
 from dotenv import load_dotenv
 import os
 import time
 import re
+from html import unescape
 from pathlib import Path
 
 # Use writable config directory - MUST BE BEFORE load_dotenv()
@@ -47,55 +50,883 @@ SCOPES = ['https://www.googleapis.com/auth/gmail.modify', 'https://www.googleapi
 TOKEN_FILE = str(CONFIG_DIR / 'token.pickle')
 CACHE_FILE = str(CONFIG_DIR / 'email_cache.pickle')
 APP_START_TIME_FILE = str(CONFIG_DIR / 'app_start_time.txt')
-CONTACTS_CACHE_FILE = str(CONFIG_DIR / 'contacts_cache.pickle')
+CONTACTS_CACHE_FILE = str(CONFIG_DIR / 'contacts_cache.bin')
+LEGACY_CONTACTS_CACHE_FILE = str(CONFIG_DIR / 'contacts_cache.pickle')
 USER_PROFILE_CACHE_FILE = str(CONFIG_DIR / 'user_profile_cache.pickle')
+THUMBNAIL_DIR = CONFIG_DIR / 'thumbnails'
+ATTACHMENT_DIR = CONFIG_DIR / 'attachments'
 
+# Background sync while the daemon's window is hidden: start at the minimum
+# interval, double on every sync that finds nothing new, reset on new mail
+SYNC_MIN_INTERVAL_SEC = 120
+SYNC_MAX_INTERVAL_SEC = 900
 
-# IPC receiver for messages from face
-class IPCReceiver(QThread):
-    message_received = Signal(str, str)  # type, content
+
+# ============================
+# Lazy imports
+# ============================
+# The Google client libraries and openai take well over a second to import
+# together, so they are pulled in by StartupThread after the window is up
+# rather than at module load. These wrappers keep the call sites unchanged.
+HEAVY_MODULES = (
+    'google.oauth2.credentials',
+    'google.auth.transport.requests',
+    'googleapiclient.discovery',
+    'openai',
+)
+
+
+def build(*args, **kwargs):
+    from googleapiclient.discovery import build as _build
+    return _build(*args, **kwargs)
+
+
+def Request():
+    from google.auth.transport.requests import Request as _Request
+    return _Request()
+
+
+def OpenAI(**kwargs):
+    from openai import OpenAI as _OpenAI
+    return _OpenAI(**kwargs)
+
+
+# ============================
+# Junk address classifier (contact harvesting)
+# ============================
+class JunkAddressClassifier:
+    """Flags automated / bulk-mail addresses so they stay out of the contact list.
+
+    All keyword checks are folded into precompiled patterns, sender subdomains and
+    mail-provider domains are set lookups, and every verdict is memoised so a
+    sender that shows up in thousands of headers is only classified once.
+    """
+
+    KEYWORDS = ('noreply', 'no-reply', 'donotreply', 'do-not-reply',
+                'bounce', 'mailer-daemon', 'postmaster')
+    SENDER_SUBDOMAINS = frozenset({'notifications', 'alerts', 'updates', 'news', 'marketing'})
+    PROVIDER_DOMAIN_SUFFIXES = frozenset({'hubspotemail.net', 'sendgrid.net'})
+    PROVIDER_KEYWORDS = ('mailchimp', 'amazonses', 'postmarkapp', 'mailgun')
+    MAX_LOCAL_LENGTH = 30
+    MAX_LOCAL_DIGITS = 10
+    MEMO_SIZE = 50000
 
     def __init__(self):
+        self._keyword_re = re.compile('|'.join(re.escape(k) for k in self.KEYWORDS))
+        self._provider_re = re.compile('|'.join(re.escape(k) for k in self.PROVIDER_KEYWORDS))
+        self._digit_re = re.compile(r'\d')
+        self._memo = {}
+
+    def is_junk(self, addr):
+        addr = addr.lower()
+        verdict = self._memo.get(addr)
+        if verdict is None:
+            verdict = self._classify(addr)
+            if len(self._memo) >= self.MEMO_SIZE:
+                self._memo.clear()
+            self._memo[addr] = verdict
+        return verdict
+
+    def _classify(self, addr):
+        if self._keyword_re.search(addr):
+            return True
+
+        local, _, domain = addr.partition('@')
+        if '=' in local:
+            return True
+        if len(local) > self.MAX_LOCAL_LENGTH:
+            return True
+        if len(local) >= 20 and local.isascii() and local.isalnum():
+            return True
+        if len(self._digit_re.findall(local)) > self.MAX_LOCAL_DIGITS:
+            return True
+
+        if domain:
+            head, dot, rest = domain.partition('.')
+            if dot and head in self.SENDER_SUBDOMAINS:
+                return True
+            if self._provider_re.search(domain):
+                return True
+            while dot:
+                if domain in self.PROVIDER_DOMAIN_SUFFIXES:
+                    return True
+                _, dot, domain = domain.partition('.')
+        return False
+
+
+JUNK_CLASSIFIER = JunkAddressClassifier()
+
+
+def is_junk_email(addr):
+    return JUNK_CLASSIFIER.is_junk(addr)
+
+
+# ============================
+# Body normalization (pure functions, safe to call from worker threads)
+# ============================
+# Attribution lines carry the quoted message's date or time ("Mar 3, 2025", "3/3/25", "09:14"),
+# which tells them apart from prose such as "On reflection, Dawit wrote:"
+_QUOTE_DATE_SHAPE = (
+    r'(?:\d{1,2}:\d{2}|\d{1,4}[./-]\d{1,2}[./-]\d{2,4}|\b(?:19|20)\d{2}\b'
+    r'|\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{1,2}\b'
+    r'|\b\d{1,2}\.?\s+(?:jan|feb|mar|mär|apr|avr|may|mai|jun|juin|jul|juil|aug|août|sep|oct|okt|nov|dec|dez|déc))'
+)
+# Quoted history, plain text: attribution lines and client separators, anchored at line start
+_TEXT_QUOTE_RE = re.compile(
+    r'^(?:'
+    r'On\b(?=[^\n]{0,250}?' + _QUOTE_DATE_SHAPE + r')'
+    r'[^\n]{0,250}(?:\n[^\n]{0,250})?\bwrote:[ \t]*$'             # Gmail / Apple (may wrap once)
+    r'|Am\b(?=[^\n]{0,250}?' + _QUOTE_DATE_SHAPE + r')'
+    r'[^\n]{0,250}(?:\n[^\n]{0,250})?\bschrieb[^\n]{0,60}:[ \t]*$'
+    r'|Le\b(?=[^\n]{0,250}?' + _QUOTE_DATE_SHAPE + r')'
+    r'[^\n]{0,250}(?:\n[^\n]{0,250})?\ba écrit[ \t]?:[ \t]*$'
+    r'|-{2,}[ \t]*Original Message[ \t]*-{2,}'
+    r'|_{10,}[ \t]*\n(?=From:)'                                  # Outlook separator line
+    r'|From:[^\n]*(?:@|<[^>\n]+>)[^\n]*\n(?:[^\n]*\n){0,2}?(?:Sent|Date):'   # Outlook header block
+    r')',
+    re.MULTILINE | re.IGNORECASE
+)
+# Quoted history, HTML: the reply containers each client wraps it in. A bare
+# <blockquote> is ordinary content (pull quotes), see _trailing_blockquote_start
+_HTML_QUOTE_RE = re.compile(
+    r'<(?:div|blockquote)[^>]*\bclass=["\']?[^"\'>]*\b(?:gmail_quote|protonmail_quote|yahoo_quoted|moz-cite-prefix)\b'
+    r'|<blockquote[^>]*\btype=["\']?cite'
+    r'|<div[^>]*\bid=["\']?(?:appendonsend|divRplyFwdMsg|mail-editor-reference-message-container)\b'
+    r'|<hr[^>]*\bid=["\']?stopSpelling'
+    r'|<div[^>]*\bstyle=["\'][^"\'>]*border-top:\s*solid\s*#(?:E1E1E1|B5C4DF)',
+    re.IGNORECASE
+)
+# Apple Mail leaves the "On ... wrote:" line just outside its <blockquote>
+_HTML_ATTRIBUTION_TAIL_RE = re.compile(
+    r'On\b[^<>]{0,300}wrote:\s*(?:</?(?:div|br|p|span)\b[^>]*>\s*)*$',
+    re.IGNORECASE
+)
+_HTML_DETECT_RE = re.compile(r'<(?:html|div|table)', re.IGNORECASE)
+_BLOCKQUOTE_TAG_RE = re.compile(r'<(/?)blockquote\b[^>]*>', re.IGNORECASE)
+# Dropped entirely when sanitizing: active content and comments
+_HTML_UNSAFE_RE = re.compile(
+    r'<(script|noscript|iframe|object|embed)\b.*?</\1\s*>'
+    r'|<!--.*?-->',
+    re.IGNORECASE | re.DOTALL
+)
+# Inline event handlers, removed only from inside the start tags that carry them
+_HTML_HANDLER_TAG_RE = re.compile(r'<[a-z][^>]*\son[a-z]+\s*=[^>]*>', re.IGNORECASE)
+_HTML_HANDLER_ATTR_RE = re.compile(
+    r'\son[a-z]+\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]+)',
+    re.IGNORECASE
+)
+# One scan over the markup: invisible blocks, line-breaking tags, any other tag
+_HTML_TEXT_RE = re.compile(
+    r'<(script|style|head|title|noscript)\b.*?</\1\s*>'
+    r'|<!--.*?-->'
+    r'|<(br|/?p|/?div|/?tr|/?li|/?h[1-6]|/?blockquote|/?table)\b[^>]*>'
+    r'|<[^>]+>',
+    re.IGNORECASE | re.DOTALL
+)
+_INLINE_SPACE_RE = re.compile(r'[ \t\r\f\v\xa0]+')
+_BLANK_RUN_RE = re.compile(r'\n\s*\n\s*')
+# "-- " delimiter (RFC 3676) and the common mobile client footers
+_SIGNATURE_RE = re.compile(
+    r'\n-- \n'
+    r'|\n(?:Sent from my [\w ]+|Get Outlook for \w+|Sent from Mail for Windows)\b'
+)
+_URL_RE = re.compile(r'(https?://[^\s<>"\']+)')
+
+
+def is_html_body(body):
+    return _HTML_DETECT_RE.search(body) is not None
+
+
+def _trailing_quote_block(lines):
+    """Index of the first line of a '>' block that runs to the end of the message, or None."""
+    start = None
+    for i in range(len(lines) - 1, -1, -1):
+        line = lines[i].lstrip()
+        if line.startswith('>'):
+            start = i
+        elif line:
+            break
+    return start
+
+
+def _strip_text_quote(text):
+    cut = len(text)
+    m = _TEXT_QUOTE_RE.search(text)
+    if m:
+        cut = m.start()
+
+    # Interleaved replies keep their '>' lines; only a trailing quoted block is history
+    lines = text[:cut].split('\n')
+    start = _trailing_quote_block(lines)
+    if start is not None:
+        cut = sum(len(line) + 1 for line in lines[:start])
+    return text[:cut]
+
+
+def _trailing_blockquote_start(body):
+    """Start of the last top-level <blockquote> if nothing visible follows it, else None."""
+    if 'blockquote' not in body and 'BLOCKQUOTE' not in body:
+        return None
+    depth = 0
+    start = end = None
+    for m in _BLOCKQUOTE_TAG_RE.finditer(body):
+        if not m.group(1):
+            if depth == 0:
+                start = m.start()
+            depth += 1
+        elif depth:
+            depth -= 1
+            if depth == 0:
+                end = m.end()
+    if start is None or depth or end is None or end < start:
+        return None
+    return start if not html_to_text(body[end:]) else None
+
+
+def _strip_html_quote(body):
+    m = _HTML_QUOTE_RE.search(body)
+    cut = m.start() if m else _trailing_blockquote_start(body)
+    if cut is None:
+        return body
+    kept = body[:cut]
+    # The attribution can only be in the last few hundred characters
+    tail_start = max(0, len(kept) - 600)
+    return kept[:tail_start] + _HTML_ATTRIBUTION_TAIL_RE.sub('', kept[tail_start:])
+
+
+def strip_quoted_reply(text):
+    """Drop quoted history from a reply, understanding HTML and plain-text quoting.
+
+    Returns the text unchanged when stripping would leave nothing (e.g. a bare
+    forward), so a message never turns empty because of this.
+    """
+    if not text:
+        return text
+    if is_html_body(text):
+        kept = _strip_html_quote(text)
+        if kept is not text and not html_to_text(kept):
+            return text
+        return kept.strip()
+    kept = _strip_text_quote(text).strip()
+    return kept or text.strip()
+
+
+def _strip_event_handlers(m):
+    return _HTML_HANDLER_ATTR_RE.sub('', m.group(0))
+
+
+def sanitize_html(body):
+    body = _HTML_UNSAFE_RE.sub('', body)
+    return _HTML_HANDLER_TAG_RE.sub(_strip_event_handlers, body)
+
+
+def _html_text_token(m):
+    if m.group(2):
+        return '\n'
+    return ''
+
+
+def html_to_text(body):
+    text = unescape(_HTML_TEXT_RE.sub(_html_text_token, body))
+    text = _INLINE_SPACE_RE.sub(' ', text)
+    return _BLANK_RUN_RE.sub('\n\n', text).strip()
+
+
+def split_signature(text):
+    """Return (content, signature); signature is '' when none is found."""
+    m = _SIGNATURE_RE.search(text)
+    if not m:
+        return text, ''
+    return text[:m.start()].rstrip(), text[m.start():].strip()
+
+
+def linkify(html):
+    return _URL_RE.sub(r'<a href="\1" style="color: #6eb5ff;">\1</a>', html)
+
+
+def normalize_body(body):
+    """Fetched message body -> the text kept on the message dict."""
+    return strip_quoted_reply(body)
+
+
+def summary_source_text(body):
+    """Plain text without markup or signature, for the summarizer."""
+    if is_html_body(body):
+        body = html_to_text(body)
+    return split_signature(body)[0]
+
+
+# ============================
+# Message rendering (pure functions, safe to call from worker threads)
+# ============================
+_SUMMARY_BULLET_RE = re.compile(r'<br>([•\-\*])\s*')
+_SUMMARY_NUMBERED_RE = re.compile(r'<br>(\d+\.)\s*')
+_BR_RUN_RE = re.compile(r'(<br>){3,}')
+
+
+def render_summary_html(summary_text):
+    html = summary_text.replace('\n\n', '<br><br>').replace('\n', '<br>')
+
+    html = _SUMMARY_BULLET_RE.sub(r'<br>• ', html)
+    html = _SUMMARY_NUMBERED_RE.sub(r'<br>\1 ', html)
+
+    return f"""
+        <div style='line-height: 1.8; font-size: 18px; color: #f5f5eb; text-align: left;'>
+            {html}
+        </div>
+        """
+
+
+def _plain_text_html(text):
+    # Smart newline handling
+    lines = text.replace('\r\n', '\n').split('\n')
+    result = []
+
+    for line in lines:
+        stripped = line.strip()
+
+        # Empty line = paragraph break
+        if not stripped:
+            result.append('<br><br>')
+        # Line ends with punctuation or is short = likely end of paragraph
+        elif stripped.endswith(('.', '!', '?', ':', ')')) and len(stripped) < 60:
+            result.append(stripped + '<br>')
+        # Line is very short (like "Best," or signature) = keep break
+        elif len(stripped) < 40:
+            result.append(stripped + '<br>')
+        # Otherwise join with space (soft wrap)
+        else:
+            result.append(stripped + ' ')
+
+    # Clean up multiple <br>
+    return _BR_RUN_RE.sub('<br><br>', ''.join(result))
+
+
+def render_body_html(body):
+    if is_html_body(body):
+        # It's HTML - render as-is, minus anything active
+        return sanitize_html(body)
+
+    content, signature = split_signature(body)
+    html = _plain_text_html(content)
+    if signature:
+        html += f"<br><span style='color: #a0a0a0; font-size: 14px;'>{_plain_text_html(signature)}</span>"
+    # Convert plain text URLs to clickable links
+    return linkify(html)
+
+
+def cached_render(message, key, source, render):
+    """Return render(source), cached on the message as (source, html) until source changes."""
+    cached = message.get(key)
+    if cached is None or cached[0] != source:
+        cached = (source, render(source))
+        message[key] = cached
+    return cached[1]
+
+# ============================
+# MIME part budgets and chunked base64 decoding
+# ============================
+# Byte budgets (decoded sizes); override in ~/.config/photon/.env
+MAX_PART_BYTES = int(os.environ.get('PHOTON_MAX_PART_BYTES', 5 * 1024 * 1024))
+MAX_MESSAGE_BYTES = int(os.environ.get('PHOTON_MAX_MESSAGE_BYTES', 12 * 1024 * 1024))
+MAX_TEXT_PART_BYTES = int(os.environ.get('PHOTON_MAX_TEXT_PART_BYTES', 512 * 1024))
+B64_CHUNK_CHARS = 256 * 1024  # must stay a multiple of 4
+
+
+def iter_b64url_chunks(data, limit=None):
+    """Decode URL-safe base64 piece by piece, stopping after `limit` decoded bytes."""
+    produced = 0
+    for start in range(0, len(data), B64_CHUNK_CHARS):
+        chunk = data[start:start + B64_CHUNK_CHARS]
+        if len(chunk) % 4:
+            chunk += '=' * (-len(chunk) % 4)
+        decoded = base64.urlsafe_b64decode(chunk)
+        if limit is not None and produced + len(decoded) >= limit:
+            yield decoded[:limit - produced]
+            return
+        produced += len(decoded)
+        yield decoded
+
+
+def decode_text_part(data, limit=MAX_TEXT_PART_BYTES):
+    """Decode a text/* part, keeping at most `limit` bytes of it."""
+    raw = b''.join(iter_b64url_chunks(data, limit + 1))
+    text = raw[:limit].decode('utf-8', errors='ignore')
+    if len(raw) > limit:
+        text += "\n\n[Message truncated]"
+    return text
+
+
+# ============================
+# Content-addressed attachment store
+# ============================
+ATTACHMENT_STORE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class AttachmentStore:
+    """Attachment bytes live on disk under their SHA-256, not inside message dicts.
+
+    put() returns the hash as the handle (identical attachments are stored once),
+    read() loads the file only when it is needed, and the store is trimmed to
+    max_bytes by evicting the least recently used blobs (mtime is bumped on use).
+    Blobs pinned by loaded messages are never evicted.
+    """
+
+    def __init__(self, root, max_bytes=ATTACHMENT_STORE_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = None  # computed lazily on first put
+        self._pinned = frozenset()
+
+    def pin(self, keys):
+        """Keys still referenced by loaded messages; eviction skips them."""
+        self._pinned = frozenset(keys)
+
+    def path(self, key):
+        return self.root / key[:2] / key
+
+    def put(self, data):
+        return self.put_chunks((data,))
+
+    def put_chunks(self, chunks):
+        """Stream chunks into the store (hashing as we go) and return the handle."""
+        import tempfile
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+
+            key = digest.hexdigest()
+            path = self.path(key)
+            with self._lock:
+                if path.exists():
+                    os.unlink(tmp_path)
+                    self._touch(path)
+                    return key
+                path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_path, path)
+
+                if self._total_bytes is None:
+                    self._total_bytes = sum(s for _, s, _ in self._entries())
+                else:
+                    self._total_bytes += size
+                if self._total_bytes > self.max_bytes:
+                    self._evict(keep=path)
+            return key
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def read(self, key):
+        """Return the attachment bytes, or None if it was evicted."""
+        # A plain read: QImage.loadFromData needs bytes, so an mmap would be copied anyway
+        path = self.path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        self._touch(path)
+        return data
+
+    def _touch(self, path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _entries(self):
+        for path in self.root.glob('*/*'):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            yield path, st.st_size, st.st_mtime
+
+    def _evict(self, keep=None):
+        """Delete least recently used blobs until the store is ~90% of its cap."""
+        target = int(self.max_bytes * 0.9)
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            if path == keep or path.name in self._pinned:
+                continue
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+        self._total_bytes = total
+
+
+ATTACHMENT_STORE = AttachmentStore(ATTACHMENT_DIR)
+
+
+# ============================
+# Image decoding (worker pool + LRU + on-disk thumbnails)
+# ============================
+IMAGE_DISPLAY_WIDTH = 500
+THUMBNAIL_MAX_AGE_SEC = 30 * 24 * 3600
+
+
+def _thumbnail_path(key):
+    return THUMBNAIL_DIR / f"{key}_{IMAGE_DISPLAY_WIDTH}.png"
+
+
+def prune_thumbnails():
+    """Drop thumbnails that have not been written for a month."""
+    try:
+        cutoff = time.time() - THUMBNAIL_MAX_AGE_SEC
+        for path in THUMBNAIL_DIR.glob('*.png'):
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+    except Exception:
+        pass
+
+
+class _PoolTask(QRunnable):
+    """Runs fn(*args) on a QThreadPool worker."""
+
+    def __init__(self, fn, *args):
         super().__init__()
-        self.running = True
-        self.socket = None
+        self.fn = fn
+        self.args = args
 
     def run(self):
-        """Listen for IPC messages from the face"""
-        ipc_env = os.environ.get("PHOTON_IPC", "")
+        self.fn(*self.args)
 
-        if ipc_env.startswith("unix://"):
-            socket_path = ipc_env[len("unix://"):]
-            try:
-                self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+
+class ImageCache(QObject):
+    """Decodes and scales message images on a worker pool into display-ready QImages.
+
+    Source bytes are read from ATTACHMENT_STORE only for the duration of a
+    decode. Decoded images are kept in a small LRU; images wider than the card are
+    also written to THUMBNAIL_DIR so the next session skips the decode+scale.
+    Cards ask get(); on a miss they show a placeholder and wait for image_ready.
+    """
+    image_ready = Signal(str)  # image key
+
+    def __init__(self, max_items=64, max_threads=2):
+        super().__init__()
+        self.max_items = max_items
+        self._images = OrderedDict()
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max_threads)
+        self._pool.start(_PoolTask(prune_thumbnails))
+
+    def get(self, key):
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+
+    def request(self, key):
+        with self._lock:
+            if key in self._images or key in self._pending:
+                return
+            self._pending.add(key)
+        self._pool.start(_PoolTask(self._decode, key))
+
+    def _decode(self, key):
+        """Worker-side: thumbnail from disk if present, else decode + scale (+ save thumbnail)."""
+        image = QImage()
+        thumb = _thumbnail_path(key)
+        if thumb.exists():
+            image.load(str(thumb))
+
+        if image.isNull():
+            data = ATTACHMENT_STORE.read(key)
+            if data:
+                image.loadFromData(data)
+            del data
+            if image.width() > IMAGE_DISPLAY_WIDTH:
+                image = image.scaledToWidth(IMAGE_DISPLAY_WIDTH, Qt.SmoothTransformation)
                 try:
-                    os.unlink(socket_path)
-                except:
+                    THUMBNAIL_DIR.mkdir(parents=True, exist_ok=True)
+                    image.save(str(thumb), 'PNG')
+                except Exception:
                     pass
-                self.socket.bind(socket_path)
-
-                while self.running:
-                    try:
-                        data, addr = self.socket.recvfrom(4096)
-                        message = data.decode('utf-8')
-                        if '\t' in message:
-                            msg_type, content = message.split('\t', 1)
-                            self.message_received.emit(msg_type, content)
-                    except socket.timeout:
-                        continue
-                    except Exception as e:
-                        if self.running:
-                            print(f"IPC receive error: {e}")
-            except Exception as e:
-                print(f"Failed to create IPC socket: {e}")
-        elif ipc_env.startswith("udp://"):
-            # Handle UDP if needed
+
+        self._store(key, image)
+
+    def _store(self, key, image):
+        with self._lock:
+            self._pending.discard(key)
+            if not image.isNull():
+                self._images[key] = image
+                self._images.move_to_end(key)
+                while len(self._images) > self.max_items:
+                    self._images.popitem(last=False)
+        # Emitted from the worker; delivered queued on the GUI thread.
+        # A key that is still missing from get() afterwards could not be decoded.
+        self.image_ready.emit(key)
+
+    def shutdown(self):
+        self._pool.clear()
+        self._pool.waitForDone(1000)
+
+
+
+# IPC receiver for messages from face
+# ============================
+# IPC protocol (shared with face.py)
+# ============================
+# Each frame is a 5-byte header (protocol version, payload length) followed by
+# a UTF-8 JSON object: {"id": int, "type": str, "body": str, "reply_to": int|None}.
+# Every request is ACKed on receipt; long-running ones get a typed response
+# (REPLY_SENT, DRAFT_READY, ...) carrying reply_to = the request id.
+IPC_PROTOCOL_VERSION = 1
+IPC_FRAME_HEADER = struct.Struct('!BI')
+IPC_MAX_PAYLOAD = 1024 * 1024
+IPC_CLIENT_OUTBUF_MAX = 4 * IPC_MAX_PAYLOAD   # a face that stops reading past this is dropped
+
+
+# encode_ipc_frame and IPCFrameDecoder are duplicated in face.py (IPC section);
+# any protocol change has to be made in both copies.
+def encode_ipc_frame(msg):
+    payload = json.dumps(msg, separators=(',', ':')).encode('utf-8')
+    return IPC_FRAME_HEADER.pack(IPC_PROTOCOL_VERSION, len(payload)) + payload
+
+
+class IPCFrameDecoder:
+    """Reassembles frames from a byte stream; raises ValueError on a bad frame."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        self.buffer += data
+        messages = []
+        while len(self.buffer) >= IPC_FRAME_HEADER.size:
+            version, length = IPC_FRAME_HEADER.unpack_from(self.buffer)
+            if version != IPC_PROTOCOL_VERSION:
+                raise ValueError(f"unsupported protocol version {version}")
+            if length > IPC_MAX_PAYLOAD:
+                raise ValueError(f"frame too large ({length} bytes)")
+            end = IPC_FRAME_HEADER.size + length
+            if len(self.buffer) < end:
+                break
+            msg = json.loads(bytes(self.buffer[IPC_FRAME_HEADER.size:end]).decode('utf-8'))
+            del self.buffer[:end]
+            if not isinstance(msg, dict) or not isinstance(msg.get('type'), str):
+                raise ValueError("malformed message")
+            messages.append(msg)
+        return messages
+
+
+def ipc_socket_path():
+    ipc_env = os.environ.get("PHOTON_IPC", "")
+    if ipc_env.startswith("unix://"):
+        return ipc_env[len("unix://"):]
+    return None
+
+
+def acquire_ipc_lock(socket_path):
+    """Take the exclusive lock that owns socket_path; returns the fd, or None if held."""
+    fd = os.open(socket_path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def send_to_running_instance(msg_type, body=""):
+    """Hand a request to the em.py that already owns the socket (second launch)."""
+    path = ipc_socket_path()
+    if not path:
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(2.0)
+            s.connect(path)
+            s.sendall(encode_ipc_frame({'id': 1, 'type': msg_type, 'body': body, 'reply_to': None}))
+            s.recv(64)  # wait for the ACK so the frame isn't lost on close
+        return True
+    except OSError:
+        return False
+
+
+class IPCReceiver(QObject):
+    """Stream-socket server for the face, driven by QSocketNotifier on the GUI thread.
+
+    The socket path is owned through an flock()ed "<path>.lock" file, so a
+    second em.py can't unlink and steal it from a running one. Client sockets
+    are non-blocking; replies go to a per-client output buffer drained by a
+    write notifier, so a face that stops reading never blocks the GUI thread.
+    """
+    message_received = Signal(str, str, object)  # type, body, origin (client_id, msg_id)
+    client_connected = Signal(int)
+
+    def __init__(self, parent=None, lock_fd=None):
+        super().__init__(parent)
+        self.socket = None
+        self.socket_path = None
+        self.lock_fd = lock_fd   # held flock from acquire_ipc_lock, or None to take it in start()
+        self.notifier = None
+        self.clients = {}   # client_id -> (socket, IPCFrameDecoder, read notifier, write notifier, outbuf)
+        self.next_id = 1
+
+    def start(self):
+        """Bind and listen; returns False if another em.py owns the socket."""
+        self.socket_path = ipc_socket_path()
+        if not self.socket_path:
+            print(f"Unsupported PHOTON_IPC address: {os.environ.get('PHOTON_IPC', '')}")
+            return False
+
+        if self.lock_fd is None:
+            try:
+                self.lock_fd = acquire_ipc_lock(self.socket_path)
+            except OSError as e:
+                print(f"Cannot create IPC lock file: {e}")
+                return False
+        if self.lock_fd is None:
+            print(f"IPC socket {self.socket_path} is owned by another em.py")
+            return False
+
+        try:
+            # We hold the lock, so anything at the path is stale
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.setblocking(False)
+            self.socket.bind(self.socket_path)
+            self.socket.listen(4)
+        except OSError as e:
+            print(f"Failed to create IPC socket: {e}")
+            self.stop()
+            return False
+
+        self.notifier = QSocketNotifier(self.socket.fileno(), QSocketNotifier.Read, self)
+        self.notifier.activated.connect(self._accept)
+        return True
+
+    def _accept(self, *_):
+        while True:
+            try:
+                conn, _ = self.socket.accept()
+            except (BlockingIOError, OSError):
+                return
+            conn.setblocking(False)
+            client_id = self.next_id
+            self.next_id += 1
+            notifier = QSocketNotifier(conn.fileno(), QSocketNotifier.Read, self)
+            notifier.activated.connect(lambda *_, cid=client_id: self._read(cid))
+            write_notifier = QSocketNotifier(conn.fileno(), QSocketNotifier.Write, self)
+            write_notifier.setEnabled(False)
+            write_notifier.activated.connect(lambda *_, cid=client_id: self._write(cid))
+            self.clients[client_id] = (conn, IPCFrameDecoder(), notifier, write_notifier, bytearray())
+            self.client_connected.emit(client_id)
+
+    def _read(self, client_id):
+        if client_id not in self.clients:
+            return
+        conn, decoder = self.clients[client_id][:2]
+        try:
+            data = conn.recv(65536)
+            if not data:
+                self._drop(client_id)
+                return
+            messages = decoder.feed(data)
+        except BlockingIOError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"IPC receive error: {e}")
+            self.send(client_id, {'type': 'ERROR', 'body': str(e), 'reply_to': None})
+            self._drop(client_id)
+            return
+
+        for msg in messages:
+            msg_id = msg.get('id')
+            self.send(client_id, {'type': 'ACK', 'reply_to': msg_id})
+            self.message_received.emit(msg['type'], str(msg.get('body', '')), (client_id, msg_id))
+
+    def _drop(self, client_id):
+        conn, _, notifier, write_notifier, _ = self.clients.pop(client_id, (None,) * 5)
+        for n in (notifier, write_notifier):
+            if n is not None:
+                n.setEnabled(False)
+                n.deleteLater()
+        if conn is not None:
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    def send(self, client_id, msg):
+        client = self.clients.get(client_id)
+        if client is None:
+            return False
+        outbuf = client[4]
+        if len(outbuf) > IPC_CLIENT_OUTBUF_MAX:
+            print(f"IPC client {client_id} stopped reading; dropping it")
+            self._drop(client_id)
+            return False
+        outbuf += encode_ipc_frame(msg)
+        return self._write(client_id)
+
+    def _write(self, client_id):
+        """Send as much of the client's outbuf as its socket takes without blocking."""
+        client = self.clients.get(client_id)
+        if client is None:
+            return False
+        conn, _, _, write_notifier, outbuf = client
+        try:
+            while outbuf:
+                del outbuf[:conn.send(outbuf)]
+        except BlockingIOError:
             pass
+        except OSError:
+            self._drop(client_id)
+            return False
+        write_notifier.setEnabled(bool(outbuf))
+        return True
+
+    def respond(self, origin, msg_type, body=""):
+        if origin is None:
+            return
+        client_id, msg_id = origin
+        self.send(client_id, {'type': msg_type, 'body': body, 'reply_to': msg_id})
+
+    def broadcast(self, msg_type, body=""):
+        for client_id in list(self.clients):
+            self.send(client_id, {'type': msg_type, 'body': body, 'reply_to': None})
 
     def stop(self):
-        self.running = False
-        if self.socket:
+        for client_id in list(self.clients):
+            self._drop(client_id)
+        if self.notifier is not None:
+            self.notifier.setEnabled(False)
+            self.notifier = None
+        if self.socket is not None:
             self.socket.close()
+            self.socket = None
+        if self.lock_fd is not None:
+            # Only the lock holder may remove the path
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+            os.close(self.lock_fd)
+            self.lock_fd = None
 
 
 class ComposeAndSendThread(QThread):
@@ -442,10 +1273,45 @@ class EmailFetchThread(QThread):
                     message_id = msg['id']
 
                     body = ""
-                    images = []
+                    image_keys = []
+                    deferred_images = []
+                    budget_left = MAX_MESSAGE_BYTES
+
+                    def add_text(part_body):
+                        nonlocal body, budget_left
+                        body = decode_text_part(part_body['data'])
+                        budget_left -= min(part_body.get('size', 0), MAX_TEXT_PART_BYTES)
+
+                    def add_image(part):
+                        nonlocal budget_left
+                        part_body = part['body']
+                        size = part_body.get('size', 0)
+                        fits = size <= MAX_PART_BYTES and size <= budget_left
+                        if not fits:
+                            # Too big for the budget - leave a "load image" placeholder
+                            deferred_images.append({
+                                'attachment_id': part_body.get('attachmentId'),
+                                'size': size,
+                                'mime_type': part.get('mimeType', '')
+                            })
+                            return
+
+                        if 'data' in part_body:
+                            image_keys.append(ATTACHMENT_STORE.put_chunks(iter_b64url_chunks(part_body['data'])))
+                            budget_left -= size
+                        elif 'attachmentId' in part_body:
+                            try:
+                                attachment = service.users().messages().attachments().get(
+                                    userId='me',
+                                    messageId=msg['id'],
+                                    id=part_body['attachmentId']
+                                ).execute()
+                                image_keys.append(ATTACHMENT_STORE.put_chunks(iter_b64url_chunks(attachment['data'])))
+                                budget_left -= size
+                            except:
+                                pass
 
                     def extract_parts(payload):
-                        nonlocal body, images
                         if 'parts' in payload:
                             for part in payload['parts']:
                                 mime_type = part.get('mimeType', '')
@@ -453,67 +1319,33 @@ class EmailFetchThread(QThread):
                                     extract_parts(part)
                                 elif mime_type == 'text/html' and not body:
                                     if 'data' in part['body']:
-                                        body = base64.urlsafe_b64decode(
-                                            part['body']['data']
-                                        ).decode('utf-8', errors='ignore')
+                                        add_text(part['body'])
                                 elif mime_type == 'text/plain' and not body:
                                     if 'data' in part['body']:
-                                        body = base64.urlsafe_b64decode(
-                                            part['body']['data']
-                                        ).decode('utf-8', errors='ignore')
+                                        add_text(part['body'])
                                 elif mime_type.startswith('image/'):
-                                    if 'data' in part['body']:
-                                        images.append(base64.urlsafe_b64decode(part['body']['data']))
-                                    elif 'attachmentId' in part['body']:
-                                        try:
-                                            attachment = service.users().messages().attachments().get(
-                                                userId='me',
-                                                messageId=msg['id'],
-                                                id=part['body']['attachmentId']
-                                            ).execute()
-                                            images.append(base64.urlsafe_b64decode(attachment['data']))
-                                        except:
-                                            pass
+                                    add_image(part)
                         else:
                             if 'body' in payload and 'data' in payload['body']:
                                 if payload.get('mimeType', '') == 'text/html':
-                                    body = base64.urlsafe_b64decode(
-                                        payload['body']['data']
-                                    ).decode('utf-8', errors='ignore')
+                                    add_text(payload['body'])
                                 elif payload.get('mimeType', '') == 'text/plain' and not body:
-                                    body = base64.urlsafe_b64decode(
-                                        payload['body']['data']
-                                    ).decode('utf-8', errors='ignore')
+                                    add_text(payload['body'])
 
                     extract_parts(msg['payload'])
 
-                    def clean_email_body(text):
-                        if not text:
-                            return text
-                        markers = [
-                            '\nOn ', '\n>', '\n> ', '\nFrom:',
-                            '\n-----Original Message-----',
-                            '\n________________________________',
-                            '\n---'
-                        ]
-                        earliest = len(text)
-                        for m in markers:
-                            pos = text.find(m)
-                            if pos != -1 and pos < earliest:
-                                earliest = pos
-                        if earliest < len(text):
-                            text = text[:earliest].strip()
-                        return text
-
-                    body = clean_email_body(body)
+                    body = normalize_body(body) or "[No text content]"
 
                     thread_emails.append({
                         'subject': subject,
                         'from': from_email,
                         'to': to_email,
                         'date': date,
-                        'body': body if body else "[No text content]",
-                        'images': images,
+                        'body': body,
+                        # Pre-rendered here so the GUI thread only binds it
+                        'body_html': (body, render_body_html(body)),
+                        'image_keys': image_keys,
+                        'deferred_images': deferred_images,
                         'is_unread': is_unread,
                         'message_id': message_id
                     })
@@ -534,6 +1366,31 @@ class EmailFetchThread(QThread):
             self.error.emit(f"Error fetching emails: {str(e)}")
 
 
+class AttachmentFetchThread(QThread):
+    """Fetches one deferred (oversized) attachment on demand and streams it into the store."""
+    success = Signal(str)   # attachment store key
+    error = Signal(str)
+
+    def __init__(self, credentials, message_id, attachment_id):
+        super().__init__()
+        self.credentials = credentials
+        self.message_id = message_id
+        self.attachment_id = attachment_id
+
+    def run(self):
+        try:
+            service = build('gmail', 'v1', credentials=self.credentials)
+            attachment = service.users().messages().attachments().get(
+                userId='me',
+                messageId=self.message_id,
+                id=self.attachment_id
+            ).execute()
+            key = ATTACHMENT_STORE.put_chunks(iter_b64url_chunks(attachment['data']))
+            self.success.emit(key)
+        except Exception as e:
+            self.error.emit(f"Error loading image: {str(e)}")
+
+
 class MarkReadThread(QThread):
     success = Signal()
     error = Signal(str)
@@ -557,6 +1414,45 @@ class MarkReadThread(QThread):
             self.error.emit(f"Error marking as read: {str(e)}")
 
 
+class StartupThread(QThread):
+    """Imports the heavy client libraries off the GUI thread."""
+    error = Signal(str)
+
+    def run(self):
+        import importlib
+        for name in HEAVY_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                self.error.emit(f"{name}: {e}")
+
+
+class TokenRefreshThread(QThread):
+    """Refreshes an expired access token off the GUI thread."""
+    success = Signal(object)
+    error = Signal(str, bool)   # message, whether the saved token is unusable
+
+    def __init__(self, credentials):
+        super().__init__()
+        self.credentials = credentials
+
+    def run(self):
+        from google.auth.exceptions import RefreshError
+        try:
+            self.credentials.refresh(Request())
+            with open(TOKEN_FILE, 'wb') as token:
+                pickle.dump(self.credentials, token)
+        except RefreshError as e:
+            # invalid_grant and friends: the refresh token itself is dead
+            self.error.emit(str(e), not getattr(e, 'retryable', False))
+        except Exception as e:
+            # TransportError / OSError: usually the network isn't up yet at
+            # login, so the token is kept and the refresh retried later
+            self.error.emit(str(e), False)
+        else:
+            self.success.emit(self.credentials)
+
+
 class OAuthLoginThread(QThread):
     success = Signal(object)
     error = Signal(str)
@@ -576,6 +1472,7 @@ class OAuthLoginThread(QThread):
                 if creds and creds.expired and creds.refresh_token:
                     creds.refresh(Request())
                 else:
+                    from google_auth_oauthlib.flow import InstalledAppFlow
                     flow = InstalledAppFlow.from_client_config(
                         self.client_config, SCOPES
                     )
@@ -590,7 +1487,7 @@ class OAuthLoginThread(QThread):
 
 
 class SummarizeThread(QThread):
-    success = Signal(str, str)
+    success = Signal(str, str, str)   # message_id, summary, rendered summary html
     error = Signal(str, str)
 
     def __init__(self, openai_client, email_body, subject, message_id):
@@ -602,7 +1499,8 @@ class SummarizeThread(QThread):
 
     def run(self):
         try:
-            word_count = len(self.email_body.split())
+            source_text = summary_source_text(self.email_body)
+            word_count = len(source_text.split())
 
             if word_count < 50:
                 bullet_count = "1 to 2"
@@ -651,7 +1549,7 @@ Format: Just bullet points, nothing else."""
                     },
                     {
                         "role": "user",
-                        "content": f"Subject: {self.subject}\n\nEmail content:\n{self.email_body}"
+                        "content": f"Subject: {self.subject}\n\nEmail content:\n{source_text}"
                     }
                 ],
                 max_tokens=max_tokens,
@@ -659,14 +1557,678 @@ Format: Just bullet points, nothing else."""
                 timeout=30
             )
             summary = response.choices[0].message.content
-            self.success.emit(self.message_id, summary)
+            self.success.emit(self.message_id, summary, render_summary_html(summary))
         except Exception as e:
             self.error.emit(self.message_id, f"[Summary error: {str(e)}]")
 
 
+# ============================
+# Contact harvesting
+# ============================
+def parse_contact_name(display_name, email_addr):
+    """Parse first and last name from display name or email."""
+    first, last = "", ""
+
+    # Clean display name
+    if display_name:
+        display_name = display_name.strip().strip('"').strip("'")
+        if '=' not in display_name and len(display_name) < 60:
+            parts = display_name.split()
+            if len(parts) >= 2:
+                first = parts[0].capitalize()
+                last = parts[-1].capitalize()
+            elif len(parts) == 1:
+                first = parts[0].capitalize()
+
+    # Fallback: extract from email
+    if not first and email_addr:
+        local = email_addr.split('@')[0]
+        if '.' in local:
+            parts = local.split('.')
+            first = parts[0].capitalize()
+            if len(parts) > 1:
+                last = parts[-1].capitalize()
+        elif '_' in local:
+            parts = local.split('_')
+            first = parts[0].capitalize()
+            if len(parts) > 1:
+                last = parts[-1].capitalize()
+        else:
+            first = local.capitalize()
+
+    return first, last
+
+
+class ContactBook:
+    """Immutable contact snapshot stored as parallel tuples (first, last, email).
+
+    Names are interned (they repeat a lot) and display strings are only built for
+    the rows that actually end up in the completer.
+    """
+    __slots__ = ('firsts', 'lasts', 'emails', '_displays')
+
+    def __init__(self, firsts=(), lasts=(), emails=()):
+        self.firsts = tuple(map(sys.intern, firsts))
+        self.lasts = tuple(map(sys.intern, lasts))
+        self.emails = tuple(emails)
+        self._displays = {}
+
+    def __len__(self):
+        return len(self.emails)
+
+    def records(self):
+        """Iterate (index, first, last, email) without materialising per-contact objects."""
+        return zip(range(len(self.emails)), self.firsts, self.lasts, self.emails)
+
+    def display(self, i):
+        text = self._displays.get(i)
+        if text is None:
+            first, last, addr = self.firsts[i], self.lasts[i], self.emails[i]
+            if first and last:
+                text = f"{first} {last} ({addr})"
+            elif first:
+                text = f"{first} ({addr})"
+            else:
+                text = addr
+            self._displays[i] = text
+        return text
+
+    def displays(self, limit):
+        return [self.display(i) for i in range(min(limit, len(self)))]
+
+
+def build_contact_snapshot(contacts_dict):
+    """Turn the harvester's working dict into a sorted, never-mutated ContactBook."""
+    # Sort by first name, then last name
+    rows = sorted(
+        ((info["first"], info["last"], addr) for addr, info in contacts_dict.items()),
+        key=lambda r: (r[0].lower(), r[1].lower())
+    )
+    if not rows:
+        return ContactBook()
+    firsts, lasts, emails = zip(*rows)
+    return ContactBook(firsts, lasts, emails)
+
+
+# Contacts cache layout: header (magic, version, record count, page token length and
+# the byte length of each column), the page token, then three UTF-8 columns (first
+# names, last names, emails) with one newline-separated entry per contact.
+CONTACTS_CACHE_MAGIC = b'PHCT'
+CONTACTS_CACHE_VERSION = 1
+_CONTACTS_HEADER = struct.Struct('<4sHIHIII')
+
+
+def _encode_contact_column(values):
+    return '\n'.join(v.replace('\n', ' ') for v in values).encode('utf-8')
+
+
+def save_contacts_cache(contacts, page_token=None):
+    """Save contacts in the compact column format (atomically) with optional resume page_token.
+
+    Returns True once CONTACTS_CACHE_FILE has been replaced.
+    """
+    try:
+        token = (page_token or '').encode('utf-8')
+        columns = [_encode_contact_column(col) for col in (contacts.firsts, contacts.lasts, contacts.emails)]
+        header = _CONTACTS_HEADER.pack(
+            CONTACTS_CACHE_MAGIC, CONTACTS_CACHE_VERSION, len(contacts), len(token),
+            *(len(col) for col in columns)
+        )
+
+        tmp_path = CONTACTS_CACHE_FILE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            f.write(token)
+            for col in columns:
+                f.write(col)
+        os.replace(tmp_path, CONTACTS_CACHE_FILE)
+        print(f"✅ Saved {len(contacts)} contacts to cache (complete={page_token is None})")
+        return True
+    except Exception as e:
+        print(f"❌ Cache save error: {e}")
+        return False
+
+
+def _load_legacy_contacts_cache():
+    """Read the old pickled list-of-dicts cache and convert it to the binary format."""
+    with open(LEGACY_CONTACTS_CACHE_FILE, 'rb') as f:
+        cache_data = pickle.load(f)
+    contacts = build_contact_snapshot({
+        c["email"]: {"first": c.get("first", ""), "last": c.get("last", "")}
+        for c in cache_data.get('contacts_data', [])
+    })
+    page_token = cache_data.get('page_token', None)
+    # Keep the pickle (and its resume token) until the new file really exists
+    if save_contacts_cache(contacts, page_token=page_token):
+        os.remove(LEGACY_CONTACTS_CACHE_FILE)
+    return contacts, page_token
+
+
+def load_contacts_cache():
+    """Load structured contacts from cache. Returns (contacts, page_token, found)."""
+    try:
+        if os.path.exists(CONTACTS_CACHE_FILE) and os.path.getsize(CONTACTS_CACHE_FILE) >= _CONTACTS_HEADER.size:
+            # Every column is decoded up front, so one plain read is all it takes
+            with open(CONTACTS_CACHE_FILE, 'rb') as f:
+                data = f.read()
+            magic, version, count, token_len, *col_lens = _CONTACTS_HEADER.unpack_from(data, 0)
+            if magic != CONTACTS_CACHE_MAGIC or version != CONTACTS_CACHE_VERSION:
+                raise ValueError("unrecognised contacts cache format")
+            offset = _CONTACTS_HEADER.size
+            page_token = data[offset:offset + token_len].decode('utf-8') or None
+            offset += token_len
+            columns = []
+            for col_len in col_lens:
+                columns.append(data[offset:offset + col_len].decode('utf-8').split('\n') if count else [])
+                offset += col_len
+
+            if any(len(col) != count for col in columns):
+                raise ValueError("truncated contacts cache")
+            contacts = ContactBook(*columns)
+        elif os.path.exists(LEGACY_CONTACTS_CACHE_FILE):
+            contacts, page_token = _load_legacy_contacts_cache()
+        else:
+            return ContactBook(), None, False
+
+        print(f"DEBUG: Loaded {len(contacts)} contacts from cache (page_token={page_token})")
+        return contacts, page_token, True
+    except Exception as e:
+        print(f"❌ Cache load error: {e}")
+    return ContactBook(), None, False
+
+
+class ContactHarvestThread(QThread):
+    """Walks the whole mailbox (500 messages per batch) and builds the contact list.
+
+    Never touches widgets: after each batch it saves the cache and publishes an
+    immutable snapshot through `snapshot`, which Qt queues onto the GUI thread.
+    The harvest can be paused/resumed between messages and resumes from the
+    cached page token after a restart.
+    """
+    snapshot = Signal(object)     # tuple of contact dicts
+    progress = Signal(int, int)   # messages scanned, unique contacts
+    error = Signal(str)
+
+    BATCH_SIZE = 500
+
+    def __init__(self, credentials, contacts=None, resume_token=None):
+        super().__init__()
+        self.credentials = credentials
+        self.resume_token = resume_token
+        self._contacts_dict = {} if contacts is None else {
+            addr: {"first": first, "last": last}
+            for _, first, last, addr in contacts.records()
+        }
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._stopping = False
+
+    def pause(self):
+        self._resume_event.clear()
+
+    def resume(self):
+        self._resume_event.set()
+
+    def is_paused(self):
+        return not self._resume_event.is_set()
+
+    def stop(self):
+        self._stopping = True
+        self._resume_event.set()
+
+    def _wait_if_paused(self):
+        self._resume_event.wait()
+        return not self._stopping
+
+    def _add_address(self, display_name, addr):
+        addr = addr.strip().lower()
+        if not addr or '@' not in addr or is_junk_email(addr):
+            return
+
+        first, last = parse_contact_name(display_name, addr)
+        known = self._contacts_dict.get(addr)
+        if known is None:
+            self._contacts_dict[addr] = {"first": first, "last": last}
+        else:
+            # Update if we got better name info
+            if first and not known["first"]:
+                known["first"] = first
+            if last and not known["last"]:
+                known["last"] = last
+
+    def run(self):
+        import email.utils
+
+        page_token = self.resume_token
+        if page_token:
+            print(f"🔄 Resuming contact harvest from page_token: {page_token[:20]}...")
+
+        try:
+            service = build('gmail', 'v1', credentials=self.credentials)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+
+        total_processed = 0
+        batch_count = 0
+
+        while not self._stopping:
+            try:
+                batch_count += 1
+                batch_processed = 0
+
+                while batch_processed < self.BATCH_SIZE:
+                    if not self._wait_if_paused():
+                        break
+
+                    params = {'userId': 'me', 'maxResults': min(500, self.BATCH_SIZE - batch_processed)}
+                    if page_token:
+                        params['pageToken'] = page_token
+
+                    results = service.users().messages().list(**params).execute()
+                    messages = results.get('messages', [])
+
+                    if not messages:
+                        page_token = None  # Mark as complete
+                        break
+
+                    for msg_ref in messages:
+                        if not self._wait_if_paused():
+                            break
+                        try:
+                            msg = service.users().messages().get(
+                                userId='me',
+                                id=msg_ref['id'],
+                                format='metadata',
+                                metadataHeaders=['From', 'To', 'Cc', 'Bcc']
+                            ).execute()
+                        except Exception:
+                            # Skip individual message errors silently
+                            continue
+
+                        for header in msg.get('payload', {}).get('headers', []):
+                            if header.get('name', '').lower() in ('from', 'to', 'cc', 'bcc'):
+                                value = header.get('value', '')
+                                if value:
+                                    for display_name, addr in email.utils.getaddresses([value]):
+                                        self._add_address(display_name, addr)
+
+                    if self._stopping:
+                        # Page only partly scanned - resume from the same page next time
+                        break
+
+                    batch_processed += len(messages)
+                    total_processed += len(messages)
+                    self.progress.emit(total_processed, len(self._contacts_dict))
+
+                    page_token = results.get('nextPageToken')
+                    if not page_token:
+                        break
+
+                    time.sleep(0.05)  # Small delay between requests
+
+                # END OF BATCH - publish snapshot and save cache
+                print(f"   Batch {batch_count} complete: {total_processed} messages, {len(self._contacts_dict)} contacts")
+                contacts = build_contact_snapshot(self._contacts_dict)
+                save_contacts_cache(contacts, page_token=page_token)
+                self.snapshot.emit(contacts)
+
+                if not page_token:
+                    print(f"✅ Finished! Found {len(contacts)} unique contacts (COMPLETE)")
+                    break
+
+                time.sleep(0.1)  # Small delay between batches
+
+            except Exception as e:
+                # Save what we have so far with current page_token for resuming
+                save_contacts_cache(build_contact_snapshot(self._contacts_dict), page_token=page_token)
+                self.error.emit(str(e))
+                break
+
+
+# ============================
+# Email card (pooled and re-bound on navigation)
+# ============================
+CARD_HEADER_OPACITY = 200
+CARD_CONTENT_OPACITY = 220
+
+CARD_TOGGLE_STYLE = """
+    QPushButton {
+        background-color: rgba(206,212,211,200);
+        color: black;
+        border: 1px solid #000;
+        font-weight: bold;
+        font-size: 10px;
+        padding: 2px 8px;
+    }
+    QPushButton:checked {
+        background-color: rgba(100,150,255,200);
+        color: white;
+    }
+    QPushButton:hover {
+        background-color: rgba(255, 255, 255, 255);
+        border: 2px solid #000;
+    }
+    QPushButton:checked:hover {
+        background-color: rgba(150, 200, 255, 255);
+        border: 2px solid #000;
+    }
+"""
+
+CARD_SUMMARY_BODY_STYLE = f"""
+    QLabel {{
+        color: white;
+        background-color: rgba(30, 30, 30, {CARD_CONTENT_OPACITY});
+        padding-top: 43px;
+        padding-left: 35px;
+        padding-right: 18px;
+        padding-bottom: 18px;
+        border-radius: 5px;
+        border: 1px solid rgba(200, 200, 150, 200);
+        font-size: 18px;
+    }}
+"""
+
+CARD_ORIGINAL_BODY_STYLE = f"""
+    QLabel {{
+        color: white;
+        background-color: rgba(30,30,30,{CARD_CONTENT_OPACITY});
+        padding: 18px;
+        padding-top: 38px;
+        padding-left: 30px;
+        border-radius: 5px;
+        border: 1px solid rgba(200,200,150,200);
+        font-size: 18px;
+    }}
+"""
+
+
+CARD_LOAD_IMAGE_STYLE = """
+    QPushButton {
+        background-color: rgba(206,212,211,200);
+        color: black;
+        border: 1px dashed #000;
+        border-radius: 5px;
+        padding: 10px;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: rgba(255, 255, 255, 255);
+    }
+"""
+
+
+class EmailCard(QFrame):
+    """One message card. Widgets and stylesheets are built once; bind() only swaps content."""
+
+    def __init__(self, image_cache, on_summary, on_original, on_load_image):
+        super().__init__()
+        self.setStyleSheet("QFrame { background-color: transparent; }")
+        self.image_cache = image_cache
+        self.on_load_image = on_load_image
+        self.image_keys = []
+        self.deferred_buttons = []
+        self.message = None
+        self.message_id = None
+        self.content_bound = False
+        self._body_is_summary = None
+
+        layout = QVBoxLayout()
+        layout.setSpacing(5)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # Gap between messages of the same thread
+        self.spacer = QLabel()
+        self.spacer.setFixedHeight(15)
+        self.spacer.setStyleSheet("background-color: transparent;")
+        layout.addWidget(self.spacer)
+
+        self.position_label = QLabel()
+        self.position_label.setAlignment(Qt.AlignCenter)
+        self.position_label.setStyleSheet("""
+            color: #0066cc;
+            font-size: 13px;
+            font-weight: bold;
+            padding: 5px;
+            background-color: rgba(100,150,255,100);
+            border-radius: 5px;
+        """)
+        layout.addWidget(self.position_label)
+
+        header_widget = QWidget()
+        header_layout = QVBoxLayout()
+        header_layout.setContentsMargins(10, 10, 10, 10)
+        header_widget.setStyleSheet(
+            f"background-color: rgba(206,212,211,{CARD_HEADER_OPACITY}); "
+            "border-radius: 5px;"
+        )
+
+        self.subject_label = QLabel()
+        self.subject_label.setWordWrap(True)
+        self.subject_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.subject_label.setStyleSheet("background-color: transparent;")
+        header_layout.addWidget(self.subject_label)
+
+        self.sender_label = QLabel()
+        self.sender_label.setWordWrap(True)
+        self.sender_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.sender_label.setStyleSheet("background-color: transparent;")
+        header_layout.addWidget(self.sender_label)
+
+        self.date_label = QLabel()
+        self.date_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.date_label.setStyleSheet("background-color: transparent;")
+        header_layout.addWidget(self.date_label)
+
+        header_widget.setLayout(header_layout)
+        layout.addWidget(header_widget)
+
+        summary_header = QWidget()
+        sh_layout = QHBoxLayout()
+        sh_layout.setContentsMargins(0, 0, 0, 5)
+
+        self.mode_label = QLabel()
+        sh_layout.addWidget(self.mode_label)
+        sh_layout.addStretch()
+
+        self.summary_btn = QPushButton("Summary")
+        self.summary_btn.setFixedSize(70, 25)
+        self.summary_btn.setCheckable(True)
+        self.summary_btn.clicked.connect(on_summary)
+        self.summary_btn.setStyleSheet(CARD_TOGGLE_STYLE)
+
+        self.original_btn = QPushButton("Orgn")
+        self.original_btn.setFixedSize(70, 25)
+        self.original_btn.setCheckable(True)
+        self.original_btn.clicked.connect(on_original)
+        self.original_btn.setStyleSheet(CARD_TOGGLE_STYLE)
+
+        sh_layout.addWidget(self.summary_btn)
+        sh_layout.addWidget(self.original_btn)
+
+        summary_header.setLayout(sh_layout)
+        layout.addWidget(summary_header)
+
+        content_scroll = QScrollArea()
+        content_scroll.setWidgetResizable(True)
+        content_scroll.setMinimumHeight(500)
+        content_scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+
+        content_widget = QWidget()
+        self.content_layout = QVBoxLayout()
+        self.content_layout.setContentsMargins(0, 0, 0, 0)
+        self.image_labels = []
+
+        self.body_label = QLabel()
+        self.body_label.setTextFormat(Qt.RichText)
+        self.body_label.setWordWrap(True)
+        self.body_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.body_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.body_label.setOpenExternalLinks(False)
+        self.body_label.linkActivated.connect(lambda url: __import__('webbrowser').open(url))
+        self.content_layout.addWidget(self.body_label, 1)
+
+        content_widget.setLayout(self.content_layout)
+        content_scroll.setWidget(content_widget)
+        layout.addWidget(content_scroll, 1)
+
+        self.setLayout(layout)
+
+    def _image_label(self, i):
+        while len(self.image_labels) <= i:
+            img_label = QLabel()
+            img_label.setAlignment(Qt.AlignCenter)
+            # Images sit above the body label
+            self.content_layout.insertWidget(len(self.image_labels), img_label)
+            self.image_labels.append(img_label)
+        return self.image_labels[i]
+
+    def set_images(self, email_data):
+        self.image_keys = email_data.get('image_keys', [])
+        for i, key in enumerate(self.image_keys):
+            img_label = self._image_label(i)
+            image = self.image_cache.get(key)
+            if image is not None:
+                img_label.setPixmap(QPixmap.fromImage(image))
+            else:
+                # Not decoded yet, or evicted from the LRU by prefetching; (re)queue it
+                img_label.setText("Loading image…")
+                self.image_cache.request(key)
+            img_label.setVisible(True)
+
+        for img_label in self.image_labels[len(self.image_keys):]:
+            img_label.clear()
+            img_label.setVisible(False)
+
+    def set_deferred_images(self, email_data):
+        """One "load image" button per attachment that was over the fetch budget."""
+        deferred = email_data.get('deferred_images', [])
+        for i, entry in enumerate(deferred):
+            while len(self.deferred_buttons) <= i:
+                btn = QPushButton()
+                btn.setStyleSheet(CARD_LOAD_IMAGE_STYLE)
+                btn.clicked.connect(lambda _=False, n=len(self.deferred_buttons): self.on_load_image(self.message, n))
+                # Below the images, above the body
+                self.content_layout.insertWidget(len(self.image_labels) + len(self.deferred_buttons), btn)
+                self.deferred_buttons.append(btn)
+
+            btn = self.deferred_buttons[i]
+            size_mb = entry['size'] / (1024 * 1024)
+            if not entry.get('attachment_id'):
+                btn.setText(f"Image too large to show ({size_mb:.1f} MB)")
+                btn.setEnabled(False)
+            elif entry.get('loading'):
+                btn.setText("Loading image…")
+                btn.setEnabled(False)
+            else:
+                btn.setText(f"Load image ({size_mb:.1f} MB)")
+                btn.setEnabled(True)
+            btn.setVisible(True)
+
+        for btn in self.deferred_buttons[len(deferred):]:
+            btn.setVisible(False)
+
+    def show_image(self, key):
+        """Called when a pending image finished decoding."""
+        image = self.image_cache.get(key)
+        for i, k in enumerate(self.image_keys):
+            if k == key:
+                if image is not None:
+                    self.image_labels[i].setPixmap(QPixmap.fromImage(image))
+                else:
+                    self.image_labels[i].setText("[Image unavailable]")
+
+    def set_body(self, html, is_summary):
+        if is_summary != self._body_is_summary:
+            self._body_is_summary = is_summary
+            self.body_label.setStyleSheet(CARD_SUMMARY_BODY_STYLE if is_summary else CARD_ORIGINAL_BODY_STYLE)
+            self.mode_label.setText(
+                "<b style='font-size: 14px;'>Summary:</b>" if is_summary
+                else "<b style='font-size: 14px;'>Content:</b>"
+            )
+        # Clicking a checked toggle unchecks it, so always re-assert both
+        self.summary_btn.setChecked(is_summary)
+        self.original_btn.setChecked(not is_summary)
+        self.body_label.setText(html)
+
+    def bind(self, email_data, thread_count, is_thread, message_position):
+        """Bind the cheap header parts; the body follows in bind_content()."""
+        self.message = email_data
+        self.message_id = email_data['message_id']
+        self.content_bound = False
+
+        self.spacer.setVisible(is_thread and message_position > 1)
+        self.position_label.setVisible(is_thread)
+        if is_thread:
+            self.position_label.setText(f"<b>Message {message_position} of {thread_count}</b>")
+
+        self.subject_label.setText(f"<span style='font-size: 16px;'><b>Subject:</b> {email_data['subject']}</span>")
+        self.sender_label.setText(f"<b>From:</b> {email_data['from']}")
+        self.date_label.setText(f"<b>Sent:</b> {email_data['date']}")
+
+        # Placeholder until the card is near the viewport
+        self.set_images({})
+        self.set_deferred_images({})
+        self.body_label.clear()
+
+    def bind_content(self, body_html, is_summary):
+        self.content_bound = True
+        self.set_images(self.message)
+        self.set_deferred_images(self.message)
+        self.set_body(body_html, is_summary)
+
+
+THREAD_EXPANDED_COUNT = 3     # newest messages of a thread shown as full cards
+THREAD_REVEAL_BATCH = 20      # older messages listed per click on "N earlier messages"
+CARD_PRELOAD_MARGIN_PX = 650  # bind bodies this far outside the visible area
+
+CARD_COLLAPSED_STYLE = """
+    QPushButton {
+        background-color: rgba(206,212,211,200);
+        color: black;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 10px;
+        font-size: 13px;
+        text-align: left;
+    }
+    QPushButton:hover {
+        background-color: rgba(255, 255, 255, 255);
+    }
+"""
+
+
+class CollapsedMessageRow(QPushButton):
+    """One-line header standing in for an older message until it is expanded."""
+
+    def __init__(self, on_expand):
+        super().__init__()
+        self.message_id = None
+        self.setCursor(Qt.PointingHandCursor)
+        self.setStyleSheet(CARD_COLLAPSED_STYLE)
+        self.clicked.connect(lambda: on_expand(self.message_id))
+
+    def bind_earlier(self, count):
+        """Stand in for a whole run of older messages; on_expand gets None."""
+        self.message_id = None
+        self.setText(f"▸  {count} earlier message{'s' if count != 1 else ''}")
+        self.setToolTip("List these messages")
+
+    def bind(self, email_data, message_position, thread_count):
+        self.message_id = email_data['message_id']
+        sender = email_data['from'].split('<')[0].strip().strip('"') or email_data['from']
+        text = f"▸  {message_position}/{thread_count}   {sender} — {email_data['subject']}   ·   {email_data['date']}"
+        self.setText(self.fontMetrics().elidedText(text, Qt.ElideRight, 560))
+        self.setToolTip("Show this message")
+
+
 class EmailReaderWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, daemon=False, ipc_lock_fd=None):
         super().__init__()
+        # As a daemon the window only hides on close; the face shows it again over IPC
+        self.daemon = daemon
+        self.ipc_lock_fd = ipc_lock_fd   # socket lock already taken by main(), if any
+        self.quitting = False
         self.credentials = None
         self.fetch_thread = None
         self.oauth_thread = None
@@ -693,70 +2255,220 @@ class EmailReaderWindow(QMainWindow):
 
         self.ipc_receiver = None
 
+        self.card_pool = []  # EmailCard widgets reused across navigation
+        self.row_pool = []   # CollapsedMessageRow widgets for older thread messages
+        self.expanded_message_ids = set()
+        self.revealed_row_count = 0   # older messages listed as rows; the rest share earlier_row
+        self.earlier_row = CollapsedMessageRow(lambda _: self.reveal_earlier_messages())
+        self._expanded_thread_id = None
+        self.image_cache = ImageCache()
+        self.image_cache.image_ready.connect(self.on_image_ready)
+
         self.temp_threads = []
         self.locally_read_thread_ids = set()  # Threads user has viewed in this session
 
         self.known_addresses = {}
         self.suggestion_list = []  # Add this line
-        self.contacts_data = []  # Structured contact data for search
+        self.contacts_data = ContactBook()  # Structured contact data for search (immutable snapshot)
+        self.contact_harvest_thread = None
 
         self.user_first_name = None
 
         self.recipient_model = QStringListModel()
         self.recipient_completer = None
 
+        self.startup_thread = None
+        self.sync_state = "idle"
+        self._pushed_unread = None
+
+        self.sync_interval = SYNC_MIN_INTERVAL_SEC
+        self.token_refresh_thread = None
+        self.sync_timer = QTimer(self)
+        self.sync_timer.setSingleShot(True)
+        self.sync_timer.timeout.connect(self.background_sync)
+
+        # Stage 1: everything needed to paint the window from local state
         self.load_app_start_time()
         self.load_cache()
-        self.setup_openai()
         self.init_ui()
         self.setup_ipc()
 
+        # Where the face wants us: the SHOW message's "x,y", or the launch env for a cold start
+        self.face_anchor = None
         try:
             if "EM_WINDOW_X" in os.environ and "EM_WINDOW_Y" in os.environ:
-                x = int(os.environ["EM_WINDOW_X"])
-                y = int(os.environ["EM_WINDOW_Y"])
-                QTimer.singleShot(100, lambda: self.move(x, y))
-        except:
+                self.face_anchor = (int(os.environ["EM_WINDOW_X"]), int(os.environ["EM_WINDOW_Y"]))
+        except ValueError:
             pass
 
+        # Stage 2 runs once the event loop has shown the window
+        QTimer.singleShot(0, self.start_background_init)
+
+    def start_background_init(self):
+        self.startup_thread = StartupThread()
+        self.startup_thread.error.connect(lambda msg: print(f"Startup import failed: {msg}"))
+        self.startup_thread.finished.connect(self.on_background_init_finished)
+        self.startup_thread.start()
+
+    def on_background_init_finished(self):
+        self.setup_openai()
         self.auto_authenticate()
 
     def setup_ipc(self):
         """Setup IPC receiver to get messages from face"""
-        self.ipc_receiver = IPCReceiver()
+        self.ipc_receiver = IPCReceiver(self, lock_fd=self.ipc_lock_fd)
         self.ipc_receiver.message_received.connect(self.handle_ipc_message)
-        self.ipc_receiver.start()
+        self.ipc_receiver.client_connected.connect(self.push_face_snapshot)
+        if not self.ipc_receiver.start():
+            print("IPC receiver failed to start; the face cannot reach this window")
+            self.ipc_receiver = None
+            if self.daemon:
+                # Nothing could ever show a hidden window again
+                print("Not running as a daemon without IPC")
+                self.daemon = False
+
+    def ipc_respond(self, origin, msg_type, body=""):
+        if self.ipc_receiver:
+            self.ipc_receiver.respond(origin, msg_type, body)
+
+    def ipc_broadcast(self, msg_type, body=""):
+        if self.ipc_receiver:
+            self.ipc_receiver.broadcast(msg_type, body)
+
+    # Events pushed to the face: UNREAD <count>, SYNC syncing|idle|error,
+    # SENT / SEND_FAILED <text> for mail sent from this window (not for the face's
+    # own SUBMITs, which get REPLY_SENT / REPLY_FAILED instead), HIDDEN.
+    def unread_thread_count(self):
+        return sum(
+            1 for t in self.emails_data or []
+            if t['thread_id'] not in self.locally_read_thread_ids
+            and any(m['is_unread'] for m in t['messages'])
+        )
 
-    def handle_ipc_message(self, msg_type, content):
+    def push_unread_count(self):
+        count = self.unread_thread_count()
+        if count != self._pushed_unread:
+            self._pushed_unread = count
+            self.ipc_broadcast("UNREAD", str(count))
+
+    def set_sync_state(self, state):
+        if state != self.sync_state:
+            self.sync_state = state
+            self.ipc_broadcast("SYNC", state)
+
+    def push_face_snapshot(self, client_id):
+        """Bring a newly connected face up to date."""
+        self.ipc_receiver.send(client_id, {'type': 'UNREAD', 'body': str(self.unread_thread_count()), 'reply_to': None})
+        self.ipc_receiver.send(client_id, {'type': 'SYNC', 'body': self.sync_state, 'reply_to': None})
+
+    def handle_ipc_message(self, msg_type, content, origin=None):
+        if msg_type == "SHOW":
+            self.show_from_face(content)
+            return
+
+        if msg_type == "HIDE":
+            self.hide_to_background()
+            return
+
+        if msg_type == "QUIT":
+            self.quit_daemon()
+            return
 
         # NEW: a compose request from face
         if msg_type == "COMPOSE":
             # Ensure UI is in compose screen
             self.enter_compose_mode()
-            self.generate_ai_compose(content)
+            self.generate_ai_compose(content, origin)
             return
 
         # Existing behavior (reply)
         if msg_type == "SUBMIT":
             if self.compose_mode:
-                self.generate_ai_compose(content)
+                self.generate_ai_compose(content, origin)
                 return
 
             if not self.emails_data or self.current_email_index >= len(self.emails_data):
+                self.ipc_respond(origin, "REPLY_FAILED", "No email open")
                 return
 
             thread = self.emails_data[self.current_email_index]
             messages = thread['messages']
             if not messages:
+                self.ipc_respond(origin, "REPLY_FAILED", "No email open")
                 return
 
             target_message = messages[0]
-            self.compose_and_send_reply(content, target_message, thread['thread_id'])
+            self.compose_and_send_reply(content, target_message, thread['thread_id'], origin)
+
+    def show_from_face(self, content=""):
+        try:
+            x, y = (int(v) for v in content.split(','))
+            self.face_anchor = (x, y)
+        except ValueError:
+            pass
+        was_hidden = self.isHidden()
+        if not was_hidden:
+            self._position_below_face()   # no showEvent for an already visible window
+        self.sync_timer.stop()
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        if was_hidden and self.credentials and not self.compose_mode:
+            # Data is already warm; just repaint, or fetch if nothing came in yet
+            if self.emails_data:
+                self.display_current_email()
+            else:
+                self.fetch_emails(silent=True)
+
+    def hide_to_background(self):
+        if self.isHidden():
+            return
+        self.hide()
+        self.ipc_broadcast("HIDDEN")
+        self.sync_interval = SYNC_MIN_INTERVAL_SEC
+        self.schedule_background_sync()
+
+    def schedule_background_sync(self):
+        if self.daemon and self.isHidden() and not self.quitting:
+            self.sync_timer.start(self.sync_interval * 1000)
+
+    def background_sync(self):
+        """Refresh the inbox while hidden so the next open paints from warm data."""
+        if not self.isHidden():
+            return
+        if not self.credentials:
+            # Startup refresh failed offline; retry it on the sync schedule
+            refreshing = self.token_refresh_thread is not None and self.token_refresh_thread.isRunning()
+            if os.path.exists(TOKEN_FILE) and not refreshing:
+                self.auto_authenticate()
+            self.schedule_background_sync()
+            return
+        if self.compose_mode:
+            self.schedule_background_sync()
+            return
+        if self.fetch_thread is not None and self.fetch_thread.isRunning():
+            self.schedule_background_sync()
+            return
+        print(f"Background sync (next in {self.sync_interval}s unless new mail)")
+        self.fetch_emails(silent=True)
+
+    def _adapt_sync_interval(self, emails):
+        known = {t['thread_id'] for t in self.emails_data or []}
+        if any(t['thread_id'] not in known for t in emails):
+            self.sync_interval = SYNC_MIN_INTERVAL_SEC
+        else:
+            self.sync_interval = min(self.sync_interval * 2, SYNC_MAX_INTERVAL_SEC)
+
+    def quit_daemon(self):
+        self.quitting = True
+        self.close()
+        QApplication.instance().quit()
 
-    def compose_and_send_reply(self, short_text, current_email, thread_id):
+    def compose_and_send_reply(self, short_text, current_email, thread_id, origin=None):
         """Compose and send a reply based on short text input"""
         if not self.credentials or not self.openai_client:
             self.show_reply_notification("Cannot send: Not authenticated or OpenAI not configured")
+            self.ipc_respond(origin, "REPLY_FAILED", "Not authenticated or OpenAI not configured")
             return
 
         self.compose_send_thread = ComposeAndSendThread(
@@ -769,6 +2481,13 @@ class EmailReaderWindow(QMainWindow):
         )
         self.compose_send_thread.success.connect(self.on_reply_sent)
         self.compose_send_thread.error.connect(self.on_reply_error)
+        if origin is not None:
+            # Tell the face how its SUBMIT ended; it already shows that, so no SENT broadcast
+            self.compose_send_thread.success.connect(lambda _msg: self.ipc_respond(origin, "REPLY_SENT"))
+            self.compose_send_thread.error.connect(lambda err: self.ipc_respond(origin, "REPLY_FAILED", err))
+        else:
+            self.compose_send_thread.success.connect(lambda _msg: self.ipc_broadcast("SENT", "Reply sent."))
+            self.compose_send_thread.error.connect(lambda err: self.ipc_broadcast("SEND_FAILED", err))
         self.compose_send_thread.start()
 
         self.show_reply_notification("Composing and sending reply...")
@@ -818,7 +2537,9 @@ class EmailReaderWindow(QMainWindow):
             'from': "Me <me>",
             'date': full_msg.get('internalDate', ''),
             'body': body,
-            'images': [],
+            'body_html': (body, render_body_html(body)),
+            'image_keys': [],
+            'deferred_images': [],
             'is_unread': False,
             'message_id': msg_id,
             'to': ''
@@ -904,13 +2625,74 @@ class EmailReaderWindow(QMainWindow):
                 thread.deleteLater()
                 self.active_summary_threads.pop(0)
 
-    def prefetch_upcoming_summaries(self):
+    def pin_loaded_attachments(self):
+        """Keep every image a loaded message points at out of the store's LRU eviction."""
+        ATTACHMENT_STORE.pin(
+            key
+            for thread_data in self.emails_data
+            for message in thread_data['messages']
+            for key in message.get('image_keys', [])
+        )
+
+    def prefetch_upcoming_images(self, lookahead=3):
+        """Queue decoding for the current thread's images, then the next few threads'."""
+        if not self.emails_data:
+            return
+        end = min(self.current_email_index + lookahead + 1, len(self.emails_data))
+        for thread_data in self.emails_data[self.current_email_index:end]:
+            for message in thread_data['messages']:
+                for key in message.get('image_keys', []):
+                    self.image_cache.request(key)
+
+    def load_deferred_image(self, message, idx):
+        """User asked for an attachment that was skipped for being over the byte budget."""
+        deferred = message.get('deferred_images', [])
+        if idx >= len(deferred) or not self.credentials:
+            return
+        entry = deferred[idx]
+        if not entry.get('attachment_id') or entry.get('loading'):
+            return
+
+        entry['loading'] = True
+        thread = AttachmentFetchThread(self.credentials, message['message_id'], entry['attachment_id'])
+        thread.success.connect(lambda key, m=message, d=entry: self.on_deferred_image_loaded(m, d, key))
+        thread.error.connect(lambda err, m=message, d=entry: self.on_deferred_image_error(m, d, err))
+        thread.finished.connect(lambda t=thread: self._cleanup_temp_thread(t))
+        self.temp_threads.append(thread)
+        thread.start()
+        self._refresh_card_images(message)
+
+    def on_deferred_image_loaded(self, message, entry, key):
+        if entry in message.get('deferred_images', []):
+            message['deferred_images'].remove(entry)
+        message['image_keys'].append(key)
+        self.pin_loaded_attachments()
+        self.image_cache.request(key)
+        self._refresh_card_images(message)
+
+    def on_deferred_image_error(self, message, entry, error_msg):
+        entry['loading'] = False
+        self._refresh_card_images(message)
+        self.show_reply_notification(error_msg)
+
+    def _refresh_card_images(self, message):
+        for card in self.card_pool:
+            if card.message is message and not card.isHidden() and card.content_bound:
+                card.set_images(message)
+                card.set_deferred_images(message)
+
+    def on_image_ready(self, key):
+        for card in self.card_pool:
+            if not card.isHidden() and key in card.image_keys:
+                card.show_image(key)
+
+    def prefetch_upcoming_summaries(self, first_offset=1):
         if not self.openai_client:
             return
 
         self.cleanup_finished_threads()
 
-        for offset in range(1, 4):
+        for offset in range(first_offset, 4):
             next_index = self.current_email_index + offset
             if next_index >= len(self.emails_data):
                 break
@@ -925,7 +2707,7 @@ class EmailReaderWindow(QMainWindow):
                 if message_id in self.summarizing_messages:
                     continue
 
-                if offset != 1 and len(self.active_summary_threads) >= self.max_concurrent_summaries:
+                if offset > 1 and len(self.active_summary_threads) >= self.max_concurrent_summaries:
                     return
 
                 self.summarizing_messages.add(message_id)
@@ -965,7 +2747,7 @@ class EmailReaderWindow(QMainWindow):
 
         return "[Generating summary...]"
 
-    def on_summary_success(self, message_id, summary):
+    def on_summary_success(self, message_id, summary, summary_html=None):
         self.summarizing_messages.discard(message_id)
 
         if message_id not in self.email_cache:
@@ -974,12 +2756,27 @@ class EmailReaderWindow(QMainWindow):
         self.email_cache[message_id]['timestamp'] = datetime.now().timestamp()
         self.save_cache()
 
-        if self.emails_data and self.current_email_index < len(self.emails_data):
-            thread = self.emails_data[self.current_email_index]
-            for msg in thread['messages']:
-                if msg['message_id'] == message_id:
-                    self.display_current_email()
-                    break
+        if summary_html is not None:
+            # Worker already rendered it; attach so display never re-renders
+            for thread in self.emails_data or []:
+                for msg in thread['messages']:
+                    if msg['message_id'] == message_id:
+                        msg['summary_html'] = (summary, summary_html)
+
+        self._update_card_summary(message_id)
+
+    def _update_card_summary(self, message_id):
+        """Swap the body of the one on-screen card showing message_id.
+
+        Cards that are hidden, collapsed or not yet bound pick the summary up
+        from the cache when they are next bound.
+        """
+        if not self.show_summary or self.compose_mode:
+            return
+        for card in self.card_pool:
+            if card.message_id == message_id and not card.isHidden() and card.content_bound:
+                card.set_body(self._card_body_html(card.message), True)
+                return
 
     def on_summary_error(self, message_id, error_msg):
         self.summarizing_messages.discard(message_id)
@@ -991,12 +2788,7 @@ class EmailReaderWindow(QMainWindow):
         self.email_cache[message_id]['timestamp'] = datetime.now().timestamp()
         self.save_cache()
 
-        if self.emails_data and self.current_email_index < len(self.emails_data):
-            thread = self.emails_data[self.current_email_index]
-            for msg in thread['messages']:
-                if msg['message_id'] == message_id:
-                    self.display_current_email()
-                    break
+        self._update_card_summary(message_id)
 
     def init_ui(self):
         self.setWindowFlags(
@@ -1244,6 +3036,9 @@ class EmailReaderWindow(QMainWindow):
         self.email_container_layout.setContentsMargins(10, 10, 10, 0)
         self.email_container.setLayout(self.email_container_layout)
         scroll.setWidget(self.email_container)
+        # Cards below the fold get their body bound as they scroll into view
+        scroll.verticalScrollBar().valueChanged.connect(self._bind_visible_cards)
+        self.email_scroll = scroll
 
         display_layout.addWidget(scroll)
 
@@ -1459,6 +3254,7 @@ class EmailReaderWindow(QMainWindow):
         # Add to END of list, not beginning (prevents index shifting issues)
         self.emails_data.extend(fresh)
         self.new_emails_count += len(fresh)
+        self.pin_loaded_attachments()
         
         self.update_next_button()
         # DON'T call display_current_email() here - it causes the "pop up" issue
@@ -1538,19 +3334,23 @@ class EmailReaderWindow(QMainWindow):
         self.show_reply_notification("Writing email from your text...")
         # --- NEW: full AI email generator for composing ---
     
-    def generate_ai_compose(self, prompt_text):
+    def generate_ai_compose(self, prompt_text, origin=None):
         """Generate subject + body using GPT and fill compose UI."""
         if not self.openai_client:
             self.show_reply_notification("Cannot use AI: OpenAI not configured")
+            self.ipc_respond(origin, "DRAFT_FAILED", "OpenAI not configured")
             return
 
         if not prompt_text.strip():
+            self.ipc_respond(origin, "DRAFT_FAILED", "Empty prompt")
             return
 
         # Thread for GPT call
         thread = AIComposeThread(self.openai_client, prompt_text, self.user_first_name)
         thread.success.connect(self.on_ai_compose_ready)
         thread.error.connect(self.on_ai_compose_error)
+        thread.success.connect(lambda subject, _body: self.ipc_respond(origin, "DRAFT_READY", subject))
+        thread.error.connect(lambda err: self.ipc_respond(origin, "DRAFT_FAILED", err))
         thread.start()
 
         self.temp_threads.append(thread)
@@ -1594,6 +3394,7 @@ class EmailReaderWindow(QMainWindow):
 
     def on_send_new_success(self, gmail_message):
         self.show_reply_notification("Email sent.")
+        self.ipc_broadcast("SENT", "Email sent.")
         # Go back to inbox view after sending
         if self.emails_data:
             self.exit_compose_mode()
@@ -1605,6 +3406,7 @@ class EmailReaderWindow(QMainWindow):
 
     def on_send_new_error(self, error_msg):
         self.show_reply_notification(f"Send error: {error_msg}")
+        self.ipc_broadcast("SEND_FAILED", error_msg)
 
 
 
@@ -1646,312 +3448,51 @@ class EmailReaderWindow(QMainWindow):
         self.compose_to_input.textChanged.connect(self.on_recipient_text_changed)
 
 
-    def fetch_all_gmail_contacts(self):
-        """Fetch ALL emails from Gmail history and build structured contact list.
-        Fetches 500 messages per batch, saves cache after each batch, and can resume from interruption.
-        """
-        import email.utils
-        import time
-        
-        print("=" * 50)
-        print("🔍 DEBUG: fetch_all_gmail_contacts() STARTED")
-        print("=" * 50)
-        
-        # Check cache first - load existing contacts and check if complete
-        print(f"DEBUG: Checking if cache exists at: {CONTACTS_CACHE_FILE}")
-        cache_complete = self.load_contacts_cache()
-        
-        if cache_complete:
+    def start_contact_harvest(self):
+        """Show cached contacts right away, then resume/finish the harvest in the background."""
+        contacts, page_token, found = load_contacts_cache()
+        if contacts:
+            self.on_contacts_snapshot(contacts)
+
+        if found and page_token is None:
             print(f"✅ Cache is COMPLETE with {len(self.contacts_data)} contacts - no fetch needed")
             return
-        
-        # Check if we need to resume from a previous incomplete fetch
-        resume_token = getattr(self, '_resume_page_token', None)
-        if resume_token:
-            print(f"🔄 Resuming from page_token: {resume_token[:20]}...")
-        else:
-            print("DEBUG: Starting fresh fetch (no resume token)")
-        
+
         if not self.credentials:
             print("❌ DEBUG: No credentials! Cannot fetch contacts.")
             return
-        
-        print("DEBUG: Credentials OK, starting Gmail fetch...")
-        print("🔄 Fetching emails from Gmail to build contact list (500 per batch)...")
-        
-        try:
-            print("DEBUG: Building Gmail service...")
-            service = build('gmail', 'v1', credentials=self.credentials)
-            print("DEBUG: Gmail service built successfully")
-            
-            # Build contacts_dict from existing contacts_data (for resuming)
-            contacts_dict = {}
-            for contact in self.contacts_data:
-                contacts_dict[contact["email"]] = {
-                    "first": contact["first"],
-                    "last": contact["last"],
-                    "email": contact["email"]
-                }
-            print(f"DEBUG: Starting with {len(contacts_dict)} existing contacts")
-            
-            # Patterns to filter out junk/automated emails
-            junk_patterns = [
-                r'.*noreply.*', r'.*no-reply.*', r'.*donotreply.*', r'.*do-not-reply.*',
-                r'.*bounce.*', r'.*mailer-daemon.*', r'.*postmaster.*',
-                r'^[a-z0-9]{20,}@.*', r'.*@.*\.hubspotemail\.net.*',
-                r'.*@.*sendgrid\.net.*', r'.*@.*mailchimp.*', r'.*@.*amazonses.*',
-                r'.*@.*postmarkapp.*', r'.*@.*mailgun.*', r'.*=.*@.*',
-                r'.*@notifications\..*', r'.*@alerts\..*', r'.*@updates\..*',
-                r'.*@news\..*', r'.*@marketing\..*',
-            ]
-            
-            def is_junk_email(addr):
-                addr_lower = addr.lower()
-                for pattern in junk_patterns:
-                    if re.match(pattern, addr_lower):
-                        return True
-                local = addr_lower.split('@')[0]
-                if len(local) > 30:
-                    return True
-                digit_count = sum(1 for c in local if c.isdigit())
-                if digit_count > 10:
-                    return True
-                return False
-            
-            def parse_name(display_name, email_addr):
-                """Parse first and last name from display name or email."""
-                first, last = "", ""
-                
-                # Clean display name
-                if display_name:
-                    display_name = display_name.strip().strip('"').strip("'")
-                    if '=' not in display_name and len(display_name) < 60:
-                        parts = display_name.split()
-                        if len(parts) >= 2:
-                            first = parts[0].capitalize()
-                            last = parts[-1].capitalize()
-                        elif len(parts) == 1:
-                            first = parts[0].capitalize()
-                
-                # Fallback: extract from email
-                if not first and email_addr:
-                    local = email_addr.split('@')[0]
-                    if '.' in local:
-                        parts = local.split('.')
-                        first = parts[0].capitalize()
-                        if len(parts) > 1:
-                            last = parts[-1].capitalize()
-                    elif '_' in local:
-                        parts = local.split('_')
-                        first = parts[0].capitalize()
-                        if len(parts) > 1:
-                            last = parts[-1].capitalize()
-                    else:
-                        first = local.capitalize()
-                
-                return first, last
-            
-            total_processed = 0
-            batch_count = 0
-            page_token = resume_token  # Start from resume token if available
-            BATCH_SIZE = 500
-            
-            print("DEBUG: Starting message fetch loop...")
-            
-            while True:
-                try:
-                    batch_count += 1
-                    batch_processed = 0
-                    
-                    # Fetch up to 500 messages per batch
-                    while batch_processed < BATCH_SIZE:
-                        params = {'userId': 'me', 'maxResults': min(500, BATCH_SIZE - batch_processed)}
-                        if page_token:
-                            params['pageToken'] = page_token
-                        
-                        print(f"DEBUG: Fetching messages (batch {batch_count}, processed so far: {total_processed})...")
-                        results = service.users().messages().list(**params).execute()
-                        messages = results.get('messages', [])
-                        
-                        print(f"DEBUG: Got {len(messages)} messages in this request")
-                        
-                        if not messages:
-                            print("DEBUG: No more messages, fetch complete!")
-                            page_token = None  # Mark as complete
-                            break
-                        
-                        for msg_ref in messages:
-                            try:
-                                msg = service.users().messages().get(
-                                    userId='me',
-                                    id=msg_ref['id'],
-                                    format='metadata',
-                                    metadataHeaders=['From', 'To', 'Cc', 'Bcc']
-                                ).execute()
-                                
-                                headers = msg.get('payload', {}).get('headers', [])
-                                
-                                for header in headers:
-                                    header_name = header.get('name', '').lower()
-                                    if header_name in ['from', 'to', 'cc', 'bcc']:
-                                        value = header.get('value', '')
-                                        if value:
-                                            for display_name, addr in email.utils.getaddresses([value]):
-                                                addr = addr.strip().lower()
-                                                
-                                                if not addr or '@' not in addr:
-                                                    continue
-                                                if is_junk_email(addr):
-                                                    continue
-                                                
-                                                first, last = parse_name(display_name, addr)
-                                                
-                                                # Store or update contact
-                                                if addr not in contacts_dict:
-                                                    contacts_dict[addr] = {"first": first, "last": last, "email": addr}
-                                                else:
-                                                    # Update if we got better name info
-                                                    if first and not contacts_dict[addr]["first"]:
-                                                        contacts_dict[addr]["first"] = first
-                                                    if last and not contacts_dict[addr]["last"]:
-                                                        contacts_dict[addr]["last"] = last
-                                                        
-                            except Exception as msg_err:
-                                # Skip individual message errors silently
-                                continue
-                        
-                        batch_processed += len(messages)
-                        total_processed += len(messages)
-                        
-                        page_token = results.get('nextPageToken')
-                        if not page_token:
-                            print("DEBUG: No nextPageToken, fetch complete!")
-                            break
-                        
-                        time.sleep(0.05)  # Small delay between requests
-                    
-                    # END OF BATCH - Update contacts_data and save cache
-                    print(f"   Batch {batch_count} complete: {total_processed} messages, {len(contacts_dict)} contacts")
-                    
-                    # Build contacts_data from contacts_dict
-                    self.contacts_data = []
-                    for addr, info in contacts_dict.items():
-                        first = info["first"]
-                        last = info["last"]
-                        
-                        if first and last:
-                            display = f"{first} {last} ({addr})"
-                        elif first:
-                            display = f"{first} ({addr})"
-                        else:
-                            display = addr
-                        
-                        self.contacts_data.append({
-                            "first": first,
-                            "last": last,
-                            "email": addr,
-                            "display": display
-                        })
-                    
-                    # Sort by first name, then last name
-                    self.contacts_data.sort(key=lambda x: (x["first"].lower(), x["last"].lower()))
-                    
-                    # Update completer model immediately (so recommendations work)
-                    all_displays = [c["display"] for c in self.contacts_data]
-                    self.recipient_model.setStringList(all_displays)
-                    print(f"DEBUG: Updated recipient_model with {len(all_displays)} items")
-                    
-                    # Save cache with page_token (None if complete)
-                    self.save_contacts_cache(page_token=page_token)
-                    
-                    # Check if we're done
-                    if not page_token:
-                        print(f"✅ Finished! Found {len(contacts_dict)} unique contacts (COMPLETE)")
-                        break
-                    
-                    time.sleep(0.1)  # Small delay between batches
-                        
-                except Exception as e:
-                    print(f"❌ DEBUG: Error during fetch loop: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    # Save what we have so far with current page_token for resuming
-                    self.save_contacts_cache(page_token=page_token)
-                    break
-            
-            print("=" * 50)
-            print("🔍 DEBUG: fetch_all_gmail_contacts() ENDED")
-            print("=" * 50)
-            
-        except Exception as e:
-            print(f"❌ Error fetching contacts: {e}")
-            import traceback
-            traceback.print_exc()
-    def save_contacts_cache(self, page_token=None):
-        """Save structured contacts to cache with optional page_token for resuming."""
-        print(f"DEBUG save_contacts_cache: Saving {len(self.contacts_data)} contacts...")
-        print(f"DEBUG save_contacts_cache: page_token = {page_token}")
-        print(f"DEBUG save_contacts_cache: File path = {CONTACTS_CACHE_FILE}")
-        try:
-            cache_data = {
-                'contacts_data': self.contacts_data,
-                'timestamp': time.time(),
-                'page_token': page_token  # None means complete, otherwise resume from here
-            }
-            with open(CONTACTS_CACHE_FILE, 'wb') as f:
-                pickle.dump(cache_data, f)
-            print(f"✅ Saved {len(self.contacts_data)} contacts to cache (complete={page_token is None})")
-            
-            # Verify file was created
-            if os.path.exists(CONTACTS_CACHE_FILE):
-                size = os.path.getsize(CONTACTS_CACHE_FILE)
-                print(f"DEBUG: Cache file created, size = {size} bytes")
-            else:
-                print("❌ DEBUG: Cache file NOT created!")
-                
-        except Exception as e:
-            print(f"❌ Cache save error: {e}")
-            import traceback
-            traceback.print_exc()
 
+        if self.contact_harvest_thread is not None and self.contact_harvest_thread.isRunning():
+            return
 
-    def load_contacts_cache(self):
-        """Load structured contacts from cache. Returns (success, page_token)."""
-        print(f"DEBUG load_contacts_cache: Looking for {CONTACTS_CACHE_FILE}")
-        print(f"DEBUG load_contacts_cache: File exists? {os.path.exists(CONTACTS_CACHE_FILE)}")
-        
-        if os.path.exists(CONTACTS_CACHE_FILE):
-            try:
-                with open(CONTACTS_CACHE_FILE, 'rb') as f:
-                    cache_data = pickle.load(f)
-                
-                self.contacts_data = cache_data.get('contacts_data', [])
-                page_token = cache_data.get('page_token', None)  # None = complete
-                print(f"DEBUG: Loaded {len(self.contacts_data)} contacts from cache")
-                print(f"DEBUG: page_token = {page_token} (None means complete)")
-                
-                if self.contacts_data:
-                    # Update completer model with all displays
-                    all_displays = [c["display"] for c in self.contacts_data]
-                    self.recipient_model.setStringList(all_displays)
-                    print(f"DEBUG: Updated recipient_model with {len(all_displays)} items")
-                
-                # Return True if cache is COMPLETE (page_token is None)
-                # Return False if cache is incomplete (need to resume)
-                if page_token is None:
-                    return True  # Complete, no need to fetch
-                else:
-                    # Store page_token for resuming
-                    self._resume_page_token = page_token
-                    return False  # Incomplete, need to resume
-                    
-            except Exception as e:
-                print(f"❌ Cache load error: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        self._resume_page_token = None
-        return False
+        self.contact_harvest_thread = ContactHarvestThread(
+            self.credentials,
+            contacts=self.contacts_data,
+            resume_token=page_token
+        )
+        self.contact_harvest_thread.snapshot.connect(self.on_contacts_snapshot)
+        self.contact_harvest_thread.progress.connect(self.on_contacts_progress)
+        self.contact_harvest_thread.error.connect(lambda err: print(f"❌ Error fetching contacts: {err}"))
+        self.contact_harvest_thread.start()
+
+    def on_contacts_snapshot(self, contacts):
+        """Swap in a new immutable contact snapshot published by the harvester."""
+        self.contacts_data = contacts
+        # Only rebuild the small filtered model, never the full list
+        self.on_recipient_text_changed(self.compose_to_input.text())
+
+    def on_contacts_progress(self, messages_scanned, contacts_found):
+        self.compose_to_input.setToolTip(
+            f"{contacts_found} contacts ({messages_scanned} messages scanned so far)"
+        )
+
+    def pause_contact_harvest(self):
+        if self.contact_harvest_thread is not None and self.contact_harvest_thread.isRunning():
+            self.contact_harvest_thread.pause()
+
+    def resume_contact_harvest(self):
+        if self.contact_harvest_thread is not None:
+            self.contact_harvest_thread.resume()
 
     def fetch_user_profile(self):
         """Fetch user's real name from Gmail profile or Google People API."""
@@ -2083,8 +3624,7 @@ class EmailReaderWindow(QMainWindow):
         """Dynamic search triggered on every keystroke."""
         if not text:
             # Show all contacts if empty
-            all_displays = [c["display"] for c in self.contacts_data]
-            self.recipient_model.setStringList(all_displays[:50])
+            self.recipient_model.setStringList(self.contacts_data.displays(50))
             return
         
         text_lower = text.lower().strip()
@@ -2095,21 +3635,22 @@ class EmailReaderWindow(QMainWindow):
         prefix_matches = []
         contains_matches = []
         
-        for contact in self.contacts_data:
-            first_lower = contact["first"].lower()
-            last_lower = contact["last"].lower()
-            email_lower = contact["email"].lower()
+        contacts = self.contacts_data
+        for i, first, last, email_addr in contacts.records():
+            first_lower = first.lower()
+            last_lower = last.lower()
+            email_lower = email_addr.lower()
             
             # Check prefix matches (highest priority)
             if (first_lower.startswith(text_lower) or 
                 last_lower.startswith(text_lower) or 
                 email_lower.startswith(text_lower)):
-                prefix_matches.append(contact["display"])
+                prefix_matches.append(contacts.display(i))
             # Check contains matches (lower priority)
             elif (text_lower in first_lower or 
                 text_lower in last_lower or 
                 text_lower in email_lower):
-                contains_matches.append(contact["display"])
+                contains_matches.append(contacts.display(i))
         
         # Combine: prefix matches first, then contains matches
         all_matches = prefix_matches + contains_matches
@@ -2195,10 +3736,7 @@ class EmailReaderWindow(QMainWindow):
 
     def display_no_emails(self):
         self.refresh_button.setEnabled(True)
-        for i in reversed(range(self.email_container_layout.count())):
-            w = self.email_container_layout.itemAt(i).widget()
-            if w:
-                w.setParent(None)
+        self._clear_email_container()
 
         msg = "No new emails." if self.show_unread_only else "No emails found."
         lab = QLabel(msg)
@@ -2210,10 +3748,7 @@ class EmailReaderWindow(QMainWindow):
     def show_no_more_new_emails(self):
         """Show a screen indicating no more new emails"""
         # Clear current display
-        for i in reversed(range(self.email_container_layout.count())):
-            w = self.email_container_layout.itemAt(i).widget()
-            if w:
-                w.setParent(None)
+        self._clear_email_container()
 
         # Create "no more" message
         container = QWidget()
@@ -2280,44 +3815,52 @@ class EmailReaderWindow(QMainWindow):
                         return
 
                 if creds and creds.valid:
-                    self.credentials = creds
-                    self.fetch_user_profile()
-
-                    self.login_button.setVisible(False)
-                    self.status_label.setText("Logged in! Fetching contacts and emails...")
-                    
-                    # Fetch contacts in background
-                    contact_thread = threading.Thread(target=self.fetch_all_gmail_contacts)
-                    contact_thread.daemon = True
-                    contact_thread.start()
-                    
-                    self.fetch_emails()
+                    self.on_credentials_ready(creds, "Logged in! Fetching contacts and emails...")
                     return
 
                 elif creds and creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
-                    with open(TOKEN_FILE, 'wb') as token:
-                        pickle.dump(creds, token)
-                    self.credentials = creds
-                    self.fetch_user_profile()
-
-                    self.login_button.setVisible(False)
-                    self.status_label.setText("Session refreshed! Fetching contacts and emails...")
-                    
-                    # Fetch contacts in background
-                    contact_thread = threading.Thread(target=self.fetch_all_gmail_contacts)
-                    contact_thread.daemon = True
-                    contact_thread.start()
-                    
-                    self.fetch_emails()
+                    self.status_label.setText("Refreshing session...")
+                    self.token_refresh_thread = TokenRefreshThread(creds)
+                    self.token_refresh_thread.success.connect(self.on_token_refreshed)
+                    self.token_refresh_thread.error.connect(self.on_token_refresh_error)
+                    self.token_refresh_thread.start()
                     return
-            except:
+            except Exception as e:
+                print(f"Unreadable token file, removing: {e}")
                 if os.path.exists(TOKEN_FILE):
                     os.remove(TOKEN_FILE)
 
         self.status_label.setText("Click 'Login with Google' to start")
         self.login_button.setVisible(True)
 
+    def on_credentials_ready(self, creds, status):
+        self.credentials = creds
+        self.fetch_user_profile()
+
+        self.login_button.setVisible(False)
+        self.status_label.setText(status)
+
+        # Fetch contacts in background
+        self.start_contact_harvest()
+
+        self.fetch_emails()
+
+    def on_token_refreshed(self, creds):
+        self.on_credentials_ready(creds, "Session refreshed! Fetching contacts and emails...")
+
+    def on_token_refresh_error(self, error, token_invalid):
+        print(f"Token refresh failed: {error}")
+        if token_invalid:
+            if os.path.exists(TOKEN_FILE):
+                os.remove(TOKEN_FILE)
+            self.status_label.setText("Session expired. Click 'Login with Google' to start")
+        else:
+            # background_sync retries on its schedule while hidden; the login
+            # button refreshes the same saved token when the window is open
+            self.status_label.setText("Couldn't reach Google. Click 'Login with Google' to retry")
+        self.login_button.setVisible(True)
+        self.schedule_background_sync()
+
     def start_oauth(self):
         google_id = os.environ.get('GOOGLE_CLIENT_ID') or os.environ.get('id')
         google_secret = os.environ.get('GOOGLE_CLIENT_SECRET') or os.environ.get('secret')
@@ -2351,9 +3894,7 @@ class EmailReaderWindow(QMainWindow):
         self.status_label.setText("Logged in! Fetching contacts and emails...")
         
         # Fetch contacts first
-        contact_thread = threading.Thread(target=self.fetch_all_gmail_contacts)
-        contact_thread.daemon = True
-        contact_thread.start()
+        self.start_contact_harvest()
         
         self.fetch_emails()
 
@@ -2410,11 +3951,17 @@ class EmailReaderWindow(QMainWindow):
             self.fetch_thread.success.connect(self.display_emails)
 
         self.fetch_thread.error.connect(self.on_fetch_error)
+        # Give the inbox fetch the API to itself; harvest resumes when it finishes
+        self.pause_contact_harvest()
+        self.set_sync_state("syncing")
         self.fetch_thread.start()
 
 
     def _on_fetch_thread_finished(self):
         """Clean up fetch thread after it completes"""
+        self.resume_contact_harvest()
+        if self.sync_state == "syncing":
+            self.set_sync_state("idle")
         # Re-enable buttons
         self.refresh_button.setEnabled(True)
         self.fetch_button.setEnabled(True)
@@ -2427,6 +3974,8 @@ class EmailReaderWindow(QMainWindow):
             except:
                 pass
             self.fetch_thread = None
+
+        self.schedule_background_sync()
     def on_refresh_clicked(self):
         """Handle refresh button click"""
         if self.credentials:
@@ -2509,11 +4058,14 @@ class EmailReaderWindow(QMainWindow):
                 self.next_button.setEnabled(False)
         else:
             self.emails_data.extend(new_emails)
+            self.pin_loaded_attachments()
             self.page_token = next_page_token
             self.has_more_emails = next_page_token is not None
             self.next_button.setEnabled(self.current_email_index < len(self.emails_data) - 1)
             self.prefetch_upcoming_summaries()
+            self.prefetch_upcoming_images()
             self.update_recipient_suggestions()
+            self.push_unread_count()
 
         self.is_loading_more = False
 
@@ -2527,10 +4079,15 @@ class EmailReaderWindow(QMainWindow):
         if not self.emails_data:
             return
 
+        if self.isHidden():
+            # Background sync: warm summaries and images, but leave read state
+            # and rendering until the window is actually shown
+            self.prefetch_upcoming_summaries(first_offset=0)
+            self.prefetch_upcoming_images()
+            return
+
         thread_data = self.emails_data[self.current_email_index]
         messages = thread_data['messages']
-        is_thread = thread_data['is_thread']
-        thread_count = thread_data['thread_count']
         thread_id = thread_data['thread_id']
 
         if thread_id not in self.viewed_email_ids:
@@ -2544,11 +4101,9 @@ class EmailReaderWindow(QMainWindow):
         has_unread = any(m['is_unread'] for m in messages)
         if has_unread:
             self.mark_thread_as_read_immediate(thread_data)
+            self.push_unread_count()
 
-        for i in reversed(range(self.email_container_layout.count())):
-            w = self.email_container_layout.itemAt(i).widget()
-            if w:
-                w.setParent(None)
+        self.prefetch_upcoming_images()
 
         if self.show_unread_only:
             self.prev_button.setEnabled(False)
@@ -2566,267 +4121,126 @@ class EmailReaderWindow(QMainWindow):
                 (self.has_more_emails and not self.is_loading_more)
             )
 
-
-        for idx, message in enumerate(messages):
-            is_latest = (idx == 0)
-            msg_position = idx + 1
-
-            card = self.create_email_card(
-                message,
-                idx,
-                thread_count,
-                is_thread,
-                is_latest,
-                msg_position
-            )
-            self.email_container_layout.addWidget(card)
-
-            if is_thread and idx < len(messages) - 1:
-                spacer = QLabel()
-                spacer.setFixedHeight(15)
-                spacer.setStyleSheet("background-color: transparent;")
-                self.email_container_layout.addWidget(spacer)
-
-        self.email_container_layout.addStretch()
+        self._render_thread(thread_data)
         self.prefetch_upcoming_summaries()
 
-    def create_email_card(self, email_data, idx, thread_count, is_thread, is_latest, message_position):
-        frame = QFrame()
-        frame.setStyleSheet("QFrame { background-color: transparent; }")
-        layout = QVBoxLayout()
-        layout.setSpacing(5)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        HEADER_OPACITY = 200
-        CONTENT_OPACITY = 220
-
-        if is_thread:
-            msg_label = QLabel(f"<b>Message {message_position} of {thread_count}</b>")
-            msg_label.setAlignment(Qt.AlignCenter)
-            msg_label.setStyleSheet("""
-                color: #0066cc;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 5px;
-                background-color: rgba(100,150,255,100);
-                border-radius: 5px;
-            """)
-            layout.addWidget(msg_label)
-
-        header_widget = QWidget()
-        header_layout = QVBoxLayout()
-        header_layout.setContentsMargins(10, 10, 10, 10)
-        header_widget.setStyleSheet(
-            f"background-color: rgba(206,212,211,{HEADER_OPACITY}); "
-            "border-radius: 5px;"
-        )
-
-        subject = QLabel(f"<span style='font-size: 16px;'><b>Subject:</b> {email_data['subject']}</span>")
-        subject.setWordWrap(True)
-        subject.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        subject.setStyleSheet("background-color: transparent;")
-        header_layout.addWidget(subject)
-
-
-        sender = QLabel(f"<b>From:</b> {email_data['from']}")
-        sender.setWordWrap(True)
-        sender.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        sender.setStyleSheet("background-color: transparent;")
-        header_layout.addWidget(sender)
-
-        date = QLabel(f"<b>Sent:</b> {email_data['date']}")
-        date.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        date.setStyleSheet("background-color: transparent;")
-        header_layout.addWidget(date)
-
-        header_widget.setLayout(header_layout)
-        layout.addWidget(header_widget)
-
-        summary_header = QWidget()
-        sh_layout = QHBoxLayout()
-        sh_layout.setContentsMargins(0, 0, 0, 5)
-
-        toggle_style = """
-                    QPushButton {
-                        background-color: rgba(206,212,211,200);
-                        color: black;
-                        border: 1px solid #000;
-                        font-weight: bold;
-                        font-size: 10px;
-                        padding: 2px 8px;
-                    }
-                    QPushButton:checked {
-                        background-color: rgba(100,150,255,200);
-                        color: white;
-                    }
-                    QPushButton:hover {
-                        background-color: rgba(255, 255, 255, 255);
-                        border: 2px solid #000;
-                    }
-                    QPushButton:checked:hover {
-                        background-color: rgba(150, 200, 255, 255);
-                        border: 2px solid #000;
-                    }
-                """
-
-        if self.show_summary:
-            sh_layout.addWidget(QLabel("<b style='font-size: 14px;'>Summary:</b>"))
-        else:
-            sh_layout.addWidget(QLabel("<b style='font-size: 14px;'>Content:</b>"))
-
-        sh_layout.addStretch()
-
-        summary_btn = QPushButton("Summary")
-        summary_btn.setFixedSize(70, 25)
-        summary_btn.setCheckable(True)
-        summary_btn.setChecked(self.show_summary)
-        summary_btn.clicked.connect(self.switch_to_summary)
-        summary_btn.setStyleSheet(toggle_style)
-
-        original_btn = QPushButton("Orgn")
-        original_btn.setFixedSize(70, 25)
-        original_btn.setCheckable(True)
-        original_btn.setChecked(not self.show_summary)
-        original_btn.clicked.connect(self.switch_to_original)
-        original_btn.setStyleSheet(toggle_style)
+    def _render_thread(self, thread_data, keep_scroll=False):
+        """Lay out the thread: newest messages as cards, older ones as collapsed rows.
 
-        sh_layout.addWidget(summary_btn)
-        sh_layout.addWidget(original_btn)
+        Only the first revealed_row_count older messages get a row of their own;
+        the rest are folded into a single "N earlier messages" row. Only the first
+        card gets its body bound right away; the rest are bound by
+        _bind_visible_cards once they are within CARD_PRELOAD_MARGIN_PX of the
+        viewport.
+        """
+        messages = thread_data['messages']
+        is_thread = thread_data['is_thread']
+        thread_count = thread_data['thread_count']
 
-        summary_header.setLayout(sh_layout)
-        layout.addWidget(summary_header)
+        if thread_data['thread_id'] != self._expanded_thread_id:
+            self._expanded_thread_id = thread_data['thread_id']
+            self.expanded_message_ids = {m['message_id'] for m in messages[:THREAD_EXPANDED_COUNT]}
+            self.revealed_row_count = 0
 
-        content_scroll = QScrollArea()
-        content_scroll.setWidgetResizable(True)
-        content_scroll.setMinimumHeight(500)
-        content_scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+        scroll_bar = self.email_scroll.verticalScrollBar()
+        scroll_value = scroll_bar.value() if keep_scroll else 0
+        self._clear_email_container()
 
-        content_widget = QWidget()
-        content_layout = QVBoxLayout()
-        content_layout.setContentsMargins(0, 0, 0, 0)
+        card_count = 0
+        row_count = 0
+        folded_count = 0
+        for idx, message in enumerate(messages):
+            if message['message_id'] in self.expanded_message_ids:
+                card = self._pooled_card(card_count)
+                card_count += 1
+                card.bind(message, thread_count, is_thread, idx + 1)
+                if card_count == 1:
+                    card.bind_content(self._card_body_html(message), self.show_summary)
+                widget = card
+            elif row_count < self.revealed_row_count:
+                widget = self._pooled_row(row_count)
+                row_count += 1
+                widget.bind(message, idx + 1, thread_count)
+            else:
+                # Unrevealed older messages are always the tail of the thread
+                folded_count += 1
+                continue
+            self.email_container_layout.addWidget(widget)
+            widget.show()
 
-        if email_data['images']:
-            for img_data in email_data['images']:
-                pix = QPixmap()
-                pix.loadFromData(img_data)
+        if folded_count:
+            self.earlier_row.bind_earlier(folded_count)
+            self.email_container_layout.addWidget(self.earlier_row)
+            self.earlier_row.show()
 
-                if pix.width() > 500:
-                    pix = pix.scaledToWidth(500, Qt.SmoothTransformation)
+        self.email_container_layout.addStretch()
+        self.email_container_layout.activate()
+        scroll_bar.setValue(scroll_value)
+        if card_count > 1:
+            QTimer.singleShot(0, self._bind_visible_cards)
+
+    def _bind_visible_cards(self, *_):
+        pending = [c for c in self.card_pool if not c.isHidden() and not c.content_bound]
+        if not pending:
+            return
+        self.email_container_layout.activate()
+        top = self.email_scroll.verticalScrollBar().value() - CARD_PRELOAD_MARGIN_PX
+        bottom = top + self.email_scroll.viewport().height() + 2 * CARD_PRELOAD_MARGIN_PX
+        for card in pending:
+            geo = card.geometry()
+            if geo.bottom() >= top and geo.top() <= bottom:
+                card.bind_content(self._card_body_html(card.message), self.show_summary)
+
+    def expand_message(self, message_id):
+        if not self.emails_data or message_id in self.expanded_message_ids:
+            return
+        self.expanded_message_ids.add(message_id)
+        # The card takes the row's place, so the reader stays where they were
+        self._render_thread(self.emails_data[self.current_email_index], keep_scroll=True)
 
-                img_label = QLabel()
-                img_label.setPixmap(pix)
-                img_label.setAlignment(Qt.AlignCenter)
-                content_layout.addWidget(img_label)
+    def reveal_earlier_messages(self):
+        if not self.emails_data:
+            return
+        self.revealed_row_count += THREAD_REVEAL_BATCH
+        self._render_thread(self.emails_data[self.current_email_index], keep_scroll=True)
+
+    def _pooled_row(self, idx):
+        while len(self.row_pool) <= idx:
+            self.row_pool.append(CollapsedMessageRow(self.expand_message))
+        return self.row_pool[idx]
+
+    def _clear_email_container(self):
+        """Empty the message area. Pooled cards are only detached and hidden, never destroyed."""
+        while self.email_container_layout.count():
+            item = self.email_container_layout.takeAt(0)
+            w = item.widget()
+            if w is None:
+                continue
+            if isinstance(w, (EmailCard, CollapsedMessageRow)):
+                w.hide()   # pooled (or earlier_row), reused on the next render
+            else:
+                w.setParent(None)
 
+    def _pooled_card(self, idx):
+        while len(self.card_pool) <= idx:
+            self.card_pool.append(EmailCard(
+                self.image_cache,
+                self.switch_to_summary,
+                self.switch_to_original,
+                self.load_deferred_image
+            ))
+        return self.card_pool[idx]
+
+    def _card_body_html(self, email_data):
         if self.show_summary:
             summary_text = self.summarize_email_async(
                 email_data['body'],
                 email_data['subject'],
                 email_data['message_id']
             )
+            return cached_render(email_data, 'summary_html', summary_text, render_summary_html)
 
-            html = summary_text.replace('\n\n', '<br><br>').replace('\n', '<br>')
-
-            html = re.sub(r'<br>([•\-\*])\s*', r'<br>• ', html)
-            html = re.sub(r'<br>(\d+\.)\s*', r'<br>\1 ', html)
-
-            body_label = QLabel()
-            body_label.setTextFormat(Qt.RichText)
-            body_label.setText(
-                f"""
-                <div style='line-height: 1.8; font-size: 18px; color: #f5f5eb; text-align: left;'>
-                    {html}
-                </div>
-                """
-            )
-            body_label.setWordWrap(True)
-            body_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-            body_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-            body_label.setStyleSheet(
-                f"""
-                QLabel {{
-                    color: white;
-                    background-color: rgba(30, 30, 30, {CONTENT_OPACITY});
-                    padding-top: 43px;
-                    padding-left: 35px;
-                    padding-right: 18px;
-                    padding-bottom: 18px;
-                    border-radius: 5px;
-                    border: 1px solid rgba(200, 200, 150, 200);
-                    font-size: 18px;
-                }}
-                """
-            )
-        else:
-            email_html = email_data['body']
-
-            # Check if email is HTML or plain text
-            if '<html' in email_html.lower() or '<div' in email_html.lower() or '<table' in email_html.lower():
-                # It's HTML - render as-is
-                pass
-            else:
-                # It's plain text - smart newline handling
-                email_html = email_html.replace('\r\n', '\n')
-                
-                # Split into lines
-                lines = email_html.split('\n')
-                result = []
-                
-                for i, line in enumerate(lines):
-                    stripped = line.strip()
-                    
-                    # Empty line = paragraph break
-                    if not stripped:
-                        result.append('<br><br>')
-                    # Line ends with punctuation or is short = likely end of paragraph
-                    elif stripped.endswith(('.', '!', '?', ':', ')')) and len(stripped) < 60:
-                        result.append(stripped + '<br>')
-                    # Line is very short (like "Best," or signature) = keep break
-                    elif len(stripped) < 40:
-                        result.append(stripped + '<br>')
-                    # Otherwise join with space (soft wrap)
-                    else:
-                        result.append(stripped + ' ')
-                
-                email_html = ''.join(result)
-                # Clean up multiple <br>
-                email_html = re.sub(r'(<br>){3,}', '<br><br>', email_html)
-                # Convert plain text URLs to clickable links
-                url_pattern = r'(https?://[^\s<>"\']+)'
-                email_html = re.sub(url_pattern, r'<a href="\1" style="color: #6eb5ff;">\1</a>', email_html)
-
-
-            body_label = QLabel()
-            body_label.setTextFormat(Qt.RichText)
-            body_label.setText(email_html)
-            body_label.setWordWrap(True)
-            body_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-            body_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-            body_label.setOpenExternalLinks(False)
-            body_label.linkActivated.connect(lambda url: __import__('webbrowser').open(url))
-            body_label.setStyleSheet(
-                f"""
-                QLabel {{
-                    color: white;
-                    background-color: rgba(30,30,30,{CONTENT_OPACITY});
-                    padding: 18px;
-                    padding-top: 38px;
-                    padding-left: 30px;
-                    border-radius: 5px;
-                    border: 1px solid rgba(200,200,150,200);
-                    font-size: 18px;
-                }}
-                """
-            )
-
-
-        content_layout.addWidget(body_label, 1)
-        content_widget.setLayout(content_layout)
-        content_scroll.setWidget(content_widget)
-        layout.addWidget(content_scroll, 1)
-
-        frame.setLayout(layout)
-        return frame
+        return cached_render(email_data, 'body_html', email_data['body'], render_body_html)
 
     def display_emails(self, emails, next_page_token):
         # Leaving compose mode if we were there
@@ -2837,16 +4251,25 @@ class EmailReaderWindow(QMainWindow):
         if self.show_unread_only and self.locally_read_thread_ids:
             emails = [e for e in emails if e.get('thread_id') not in self.locally_read_thread_ids]
 
+        new_count = len(emails)
+
+        if self.isHidden() and self.emails_data:
+            # Background sync: keep the user's place and any "load more" pages
+            self._adapt_sync_interval(emails)
+            emails, next_page_token = self._merge_synced_threads(emails, next_page_token)
+        else:
+            self.current_email_index = 0
+            self.viewed_email_ids.clear()
+
         self.emails_data = emails
+        self.pin_loaded_attachments()
 
         self.page_token = next_page_token
         self.is_loading_more = False
         self.has_more_emails = next_page_token is not None
-        self.current_email_index = 0
-        self.viewed_email_ids.clear()
 
         if self.show_unread_only:
-            self.new_emails_count = len(emails)
+            self.new_emails_count = new_count
         else:
             self.new_emails_count = 0
 
@@ -2854,10 +4277,7 @@ class EmailReaderWindow(QMainWindow):
         self.update_recipient_suggestions()
 
         if not emails:
-            for i in reversed(range(self.email_container_layout.count())):
-                w = self.email_container_layout.itemAt(i).widget()
-                if w:
-                    w.setParent(None)
+            self._clear_email_container()
 
             empty = QLabel("<b>NO EMAILS</b>")
             empty.setAlignment(Qt.AlignCenter)
@@ -2872,13 +4292,34 @@ class EmailReaderWindow(QMainWindow):
         self.login_widget.setVisible(False)
         self.email_display_widget.setVisible(True)
         self.compose_widget.setVisible(False)
-        pass
+        self.push_unread_count()
+
+    def _merge_synced_threads(self, emails, next_page_token):
+        """Fold a fresh first page into the loaded list and re-find the open thread."""
+        current = self.emails_data[self.current_email_index]
+        fresh = {t['thread_id'] for t in emails}
+        if self.show_unread_only:
+            # New mode filters out threads read this session, the open one
+            # included; keep it in front so the next unread is one step away
+            if current['thread_id'] not in fresh:
+                emails = [current] + emails
+        else:
+            # Threads past the first page came from "load more"; keep them
+            # behind the fresh page, along with the token that continues them
+            older = [t for t in self.emails_data if t['thread_id'] not in fresh]
+            if older:
+                next_page_token = self.page_token
+            emails = emails + older
+        self.current_email_index = next(
+            i for i, t in enumerate(emails) if t['thread_id'] == current['thread_id'])
+        return emails, next_page_token
 
     def on_fetch_error(self, error):
         self.fetch_button.setEnabled(True)
         self.fetch_button.setText("Fetch Emails")
         self.refresh_button.setEnabled(True)
         self.status_label.setText("Failed to fetch")
+        self.set_sync_state("error")
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -2897,23 +4338,13 @@ class EmailReaderWindow(QMainWindow):
 
     def showEvent(self, event):
         super().showEvent(event)
-        QTimer.singleShot(100, self._position_below_face)
-        QTimer.singleShot(500, self._position_below_face)
+        self._position_below_face()
+        # Once more after the window manager has mapped us, in case it placed the window itself
+        QTimer.singleShot(0, self._position_below_face)
 
     def _position_below_face(self):
         try:
             from PySide6.QtGui import QGuiApplication
-            import tempfile, json
-
-            pos_file = os.path.join(tempfile.gettempdir(), "photon_face_pos.json")
-            face_pos = None
-
-            if os.path.exists(pos_file):
-                try:
-                    with open(pos_file, "r") as f:
-                        face_pos = json.load(f)
-                except:
-                    pass
 
             screen = QGuiApplication.primaryScreen()
             if not screen:
@@ -2922,9 +4353,8 @@ class EmailReaderWindow(QMainWindow):
             geo = screen.availableGeometry()
             margin = max(int(0.02 * min(geo.width(), geo.height())), 8)
 
-            if face_pos:
-                x = face_pos["x"]
-                y = face_pos["y"] + face_pos["height"] +10
+            if self.face_anchor:
+                x, y = self.face_anchor
             else:
                 FACE_SIZE_INCH = 1.25
                 dpi = screen.logicalDotsPerInch() or 96.0
@@ -2947,11 +4377,26 @@ class EmailReaderWindow(QMainWindow):
             pass
 
     def closeEvent(self, event):
+        if self.daemon and not self.quitting:
+            # Keep credentials, caches and fetched threads warm for the next open
+            event.ignore()
+            self.hide_to_background()
+            return
+
         self.new_email_check_timer.stop()
 
+        if self.contact_harvest_thread and self.contact_harvest_thread.isRunning():
+            self.contact_harvest_thread.stop()
+            self.contact_harvest_thread.wait(1000)
+
+        self.image_cache.shutdown()
+
         if self.ipc_receiver:
             self.ipc_receiver.stop()
-            self.ipc_receiver.wait(1000)
+
+        if self.startup_thread and self.startup_thread.isRunning():
+            # Imports can't be interrupted; they finish in well under this
+            self.startup_thread.wait(5000)
 
         if self.fetch_thread and self.fetch_thread.isRunning():
             self.fetch_thread.quit()
@@ -3000,10 +4445,375 @@ class EmailReaderWindow(QMainWindow):
         event.accept()
 
 
+# ============================
+# Micro-benchmarks: python3 em.py --bench [name ...]
+# ============================
+# Benches that also check a labelled corpus return the number of mismatches;
+# any mismatch makes --bench exit non-zero.
+def _best_rate(fn, count, repeat=5):
+    """Run fn() `repeat` times and return the best items/second for `count` items."""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return count / best if best > 0 else float('inf')
+
+
+def bench_junk_classifier():
+    import random
+    rng = random.Random(1234)
+    first_names = ['anna', 'ben', 'carla', 'dawit', 'eli', 'fatima', 'george', 'hana']
+    domains = ['gmail.com', 'outlook.com', 'university.edu', 'company.io',
+               'news.example.com', 'em.sendgrid.net', 'mail.mailchimp.com']
+    locals_ = ['noreply', 'no-reply', 'team', 'support', 'billing']
+    addresses = []
+    for i in range(20000):
+        kind = rng.random()
+        if kind < 0.6:
+            local = f"{rng.choice(first_names)}.{rng.choice(first_names)}{i}"
+        elif kind < 0.8:
+            local = rng.choice(locals_) + str(i)
+        else:
+            local = ''.join(rng.choice('abcdef0123456789') for _ in range(24))
+        addresses.append(f"{local}@{rng.choice(domains)}")
+
+    def cold():
+        clf = JunkAddressClassifier()
+        for a in addresses:
+            clf.is_junk(a)
+
+    warm_clf = JunkAddressClassifier()
+    for a in addresses:
+        warm_clf.is_junk(a)
+
+    def warm():
+        for a in addresses:
+            warm_clf.is_junk(a)
+
+    print(f"junk classifier (cold): {_best_rate(cold, len(addresses)):,.0f} addresses/s")
+    print(f"junk classifier (memo): {_best_rate(warm, len(addresses)):,.0f} addresses/s")
+
+
+def _body_corpus():
+    """Synthetic messages in the shapes seen in a real inbox."""
+    para = ("Thanks for sending the draft over. I read through it on the train this morning "
+            "and I think the second section needs a bit more detail on the rollout plan.\n")
+    plain_reply = (
+        "Sounds good, see you Thursday.\n\nBest,\nAnna\n\n"
+        "On Mon, Mar 3, 2025 at 9:14 AM Ben <ben@example.com> wrote:\n"
+        + "> " + para * 6
+    )
+    plain_signature = para * 8 + "\n-- \nGeorge Smith\nSenior Engineer\nhttps://example.com\n+1 555 0100\n"
+    mobile = "Running 5 minutes late.\n\nSent from my iPhone"
+    outlook = (
+        para * 3 + "\n________________________________\n"
+        "From: Carla <carla@example.com>\nSent: Tuesday\nTo: Team\nSubject: Plan\n\n" + para * 10
+    )
+    newsletter = (
+        "<html><head><style>td { padding: 4px; }</style><title>Weekly</title></head><body>"
+        "<table width='600'>"
+        + "".join(f"<tr><td onclick=\"track({i})\"><h2>Story {i}</h2><p>{para}</p>"
+                  f"<a href='https://news.example.com/{i}'>Read more &raquo;</a></td></tr>" for i in range(25))
+        + "</table><!-- tracking --><script>t()</script><img src='https://t.example.com/p.gif'></body></html>"
+    )
+    gmail_html = (
+        "<div dir='ltr'>Looks great, ship it.<br><br>Dawit</div><br>"
+        "<div class='gmail_quote'><div dir='ltr' class='gmail_attr'>On Fri, Eli wrote:<br></div>"
+        "<blockquote class='gmail_quote'>" + para * 5 + "</blockquote></div>"
+    )
+    shapes = [plain_reply, plain_signature, mobile, outlook, newsletter, gmail_html]
+    return [shapes[i % len(shapes)] + f"\n{i}" for i in range(3000)]
+
+
+# Labelled inputs for the sanitizer and signature splitter: (name, input, expected output)
+SANITIZE_CORPUS = [
+    ('event_handlers',
+     '<td onclick="track(1)" class=x><a href="#" onMouseOver=\'t()\' onload=go>Story</a></td>',
+     '<td class=x><a href="#">Story</a></td>'),
+    ('on_equals_in_prose',
+     '<div>Please set online = true and enjoy</div>',
+     '<div>Please set online = true and enjoy</div>'),
+    ('script_and_comment',
+     '<p>Hi</p><!-- tracking --><script>t()</script>',
+     '<p>Hi</p>'),
+]
+SIGNATURE_CORPUS = [
+    ('rfc3676_delimiter', 'Thanks!\n-- \nAnna\nEngineer', ('Thanks!', '-- \nAnna\nEngineer')),
+    ('bare_dashes_are_content', 'Options:\n--\nA\nB', ('Options:\n--\nA\nB', '')),
+    ('mobile_footer', 'Late.\n\nSent from my iPhone', ('Late.', 'Sent from my iPhone')),
+]
+
+
+def bench_body_normalization():
+    mismatches = 0
+    for name, html, expected in SANITIZE_CORPUS:
+        result = sanitize_html(html)
+        if result != expected:
+            mismatches += 1
+            print(f"  MISMATCH sanitize {name}: {result!r} != {expected!r}")
+    for name, text, expected in SIGNATURE_CORPUS:
+        result = split_signature(text)
+        if result != expected:
+            mismatches += 1
+            print(f"  MISMATCH signature {name}: {result!r} != {expected!r}")
+
+    corpus = _body_corpus()
+    normalized = [normalize_body(b) for b in corpus]
+
+    def normalize():
+        for b in corpus:
+            normalize_body(b)
+
+    def render():
+        for b in normalized:
+            render_body_html(b)
+
+    def summary_text():
+        for b in normalized:
+            summary_source_text(b)
+
+    print(f"body normalize:       {_best_rate(normalize, len(corpus)):,.0f} messages/s")
+    print(f"body render:          {_best_rate(render, len(corpus)):,.0f} messages/s")
+    print(f"body summary text:    {_best_rate(summary_text, len(corpus)):,.0f} messages/s")
+    return mismatches
+
+
+# Labelled replies for the quote stripper: (name, body, visible text that should remain)
+QUOTE_CORPUS = [
+    ('gmail_text',
+     "Sounds good, see you Thursday.\n\nOn Mon, Mar 3, 2025 at 9:14 AM Ben <ben@example.com> wrote:\n> Are we still on?\n",
+     "Sounds good, see you Thursday."),
+    ('gmail_text_wrapped',
+     "Yes.\n\nOn Mon, Mar 3, 2025 at 9:14 AM Benjamin Longname <benjamin.longname@example.com>\nwrote:\n\n> Can you confirm?\n",
+     "Yes."),
+    ('apple_text',
+     "Done!\n\nSent from my iPhone\n\n> On Mar 3, 2025, at 09:14, Ben <ben@example.com> wrote:\n>\n> Is it done?\n",
+     "Done!\n\nSent from my iPhone"),
+    ('outlook_text',
+     "Approved.\n\n________________________________\nFrom: Carla <carla@example.com>\nSent: Tuesday, March 4, 2025 10:02 AM\nTo: Team\nSubject: Budget\n\nPlease approve.\n",
+     "Approved."),
+    ('outlook_original_message',
+     "Thanks.\n\n-----Original Message-----\nFrom: Dawit\nSent: Monday\nTo: me\n\nHere is the file.\n",
+     "Thanks."),
+    ('outlook_header_only',
+     "Will do.\n\nFrom: Eli <eli@example.com>\nDate: Monday, 3 March 2025\nTo: me\nSubject: Task\n\nCan you take this?\n",
+     "Will do."),
+    ('german',
+     "Danke!\n\nAm Mo., 3. März 2025 um 09:14 Uhr schrieb Ben <ben@example.com>:\n> Hallo\n",
+     "Danke!"),
+    ('french',
+     "Merci.\n\nLe lun. 3 mars 2025 à 09:14, Ben <ben@example.com> a écrit :\n> Bonjour\n",
+     "Merci."),
+    ('bare_trailing_quote',
+     "Agreed with all of this.\n\n> Point one\n> Point two\n",
+     "Agreed with all of this."),
+    ('interleaved',
+     "> Can you do Friday?\nYes, after 2pm.\n\n> And the report?\nAttached.\n",
+     "> Can you do Friday?\nYes, after 2pm.\n\n> And the report?\nAttached."),
+    ('on_in_prose',
+     "Hi team,\n\nOn Monday we ship the release.\nOn Tuesday we write the notes.\n",
+     "Hi team,\n\nOn Monday we ship the release.\nOn Tuesday we write the notes."),
+    ('dash_rule',
+     "Agenda\n---\n1. Budget\n2. Hiring\n",
+     "Agenda\n---\n1. Budget\n2. Hiring"),
+    ('from_in_prose',
+     "Quick note.\nFrom: the landlord, the rent goes up next month.\nPlan accordingly.\n",
+     "Quick note.\nFrom: the landlord, the rent goes up next month.\nPlan accordingly."),
+    ('bare_forward',
+     "On Mon, Mar 3, 2025 at 9:14 AM Ben <ben@example.com> wrote:\n> The only content\n",
+     "On Mon, Mar 3, 2025 at 9:14 AM Ben <ben@example.com> wrote:\n> The only content"),
+    ('gmail_html',
+     "<div dir=\"ltr\">Looks great, ship it.<br><br>Dawit</div><br><div class=\"gmail_quote\">"
+     "<div dir=\"ltr\" class=\"gmail_attr\">On Fri, Mar 7, 2025 at 5:00 PM Eli &lt;eli@example.com&gt; wrote:<br></div>"
+     "<blockquote class=\"gmail_quote\" style=\"margin:0 0 0 .8ex\">Ready for review.</blockquote></div>",
+     "Looks great, ship it.\n\nDawit"),
+    ('gmail_html_container',
+     "<div dir=\"ltr\">Fine by me.</div><br><div class=\"gmail_quote gmail_quote_container\"><div>On Fri wrote:</div>"
+     "<blockquote>Old</blockquote></div>",
+     "Fine by me."),
+    ('apple_html',
+     "<html><body><div>Perfect, thanks.</div><div><br><blockquote type=\"cite\">On Mar 3, 2025, at 09:14, Ben wrote:<br><br>"
+     "<div>Here you go.</div></blockquote></div></body></html>",
+     "Perfect, thanks."),
+    ('apple_html_attribution_outside',
+     "<html><body><div>Perfect, thanks.</div><div><br><div>On Mar 3, 2025, at 09:14, Ben &lt;ben@example.com&gt; wrote:</div><br>"
+     "<blockquote type=\"cite\"><div>Here you go.</div></blockquote></div></body></html>",
+     "Perfect, thanks."),
+    ('outlook_web_html',
+     "<html><body><div>Confirmed for 3pm.</div><hr style=\"display:inline-block;width:98%\" tabindex=\"-1\">"
+     "<div id=\"divRplyFwdMsg\" dir=\"ltr\"><b>From:</b> Carla<br><b>Sent:</b> Tuesday</div><div>Does 3pm work?</div></body></html>",
+     "Confirmed for 3pm."),
+    ('outlook_appendonsend_html',
+     "<html><body><div>Signed and returned.</div><div id=\"appendonsend\"></div><hr><div><b>From:</b> Legal</div>"
+     "<div>Please sign.</div></body></html>",
+     "Signed and returned."),
+    ('outlook_desktop_html',
+     "<html><body><div class=\"WordSection1\"><p>See attached.</p><div><div style=\"border:none;border-top:solid #E1E1E1 1.0pt;"
+     "padding:3.0pt 0cm 0cm 0cm\"><p><b>From:</b> Dawit</p></div></div><p>Send the deck?</p></div></body></html>",
+     "See attached."),
+    ('thunderbird_html',
+     "<html><body><p>Works for me.</p><div class=\"moz-cite-prefix\">On 3/3/25 9:14 AM, Ben wrote:<br></div>"
+     "<blockquote type=\"cite\">Lunch?</blockquote></body></html>",
+     "Works for me."),
+    ('yahoo_html',
+     "<html><body><div>On my way.</div><div class=\"yahoo_quoted\"><div>On Monday, Ben wrote:</div><div>Where are you?</div></div></body></html>",
+     "On my way."),
+    ('html_newsletter',
+     "<html><body><table><tr><td><h2>This week</h2><p>Three stories worth reading.</p></td></tr></table></body></html>",
+     "This week\nThree stories worth reading."),
+    ('html_pull_quote',
+     "<html><body><h1>Weekly essay</h1><p>Intro.</p><blockquote>A quoted passage.</blockquote>"
+     "<p>My analysis continues for many paragraphs.</p></body></html>",
+     "Weekly essay\nIntro.\nA quoted passage.\nMy analysis continues for many paragraphs."),
+    ('html_trailing_blockquote',
+     "<html><body><div>Sounds right.</div><div>On Mar 3, 2025, Ben wrote:</div>"
+     "<blockquote><div>Is <blockquote>this</blockquote> right?</div></blockquote><br></body></html>",
+     "Sounds right."),
+    ('protonmail_html',
+     "<div>Received, thanks.</div><div class=\"protonmail_quote\">Original message<blockquote>Invoice</blockquote></div>",
+     "Received, thanks."),
+    ('on_wrote_in_prose',
+     "Notes\nOn reflection, the plan Dawit wrote:\nship in two phases.\n",
+     "Notes\nOn reflection, the plan Dawit wrote:\nship in two phases."),
+    ('from_date_in_prose',
+     "Itinerary\nFrom: Berlin\nDate: 3 March\nThen Paris on the 5th.\n",
+     "Itinerary\nFrom: Berlin\nDate: 3 March\nThen Paris on the 5th."),
+]
+
+
+def _quote_corpus_result(body):
+    kept = strip_quoted_reply(body)
+    if is_html_body(kept):
+        kept = html_to_text(kept)
+    return ' '.join(kept.split())
+
+
+def bench_quote_detection():
+    mismatches = 0
+    cut_cases = correct_cuts = quoted_cases = found = 0
+    original_chars = kept_chars = 0
+    for name, body, expected in QUOTE_CORPUS:
+        result = _quote_corpus_result(body)
+        visible = ' '.join((html_to_text(body) if is_html_body(body) else body).split())
+        expected = ' '.join(expected.split())
+        did_cut = result != visible
+        should_cut = expected != visible
+        cut_cases += did_cut
+        correct_cuts += did_cut and result == expected
+        quoted_cases += should_cut
+        found += should_cut and result == expected
+        original_chars += len(visible)
+        kept_chars += len(result)
+        if result != expected:
+            mismatches += 1
+            print(f"  MISMATCH {name}: {result!r} != {expected!r}")
+
+    precision = correct_cuts / cut_cases if cut_cases else 1.0
+    recall = found / quoted_cases if quoted_cases else 1.0
+    print(f"quote stripping: precision {precision:.0%}, recall {recall:.0%} "
+          f"over {len(QUOTE_CORPUS)} labelled messages; {kept_chars:,}/{original_chars:,} chars kept")
+
+    bodies = [body for _, body, _ in QUOTE_CORPUS] * 200
+    rate = _best_rate(lambda: [strip_quoted_reply(b) for b in bodies], len(bodies))
+    print(f"quote stripping: {rate:,.0f} messages/s")
+    return mismatches
+
+
+def bench_import_time():
+    """Import em in a fresh interpreter under -X importtime and report the cost."""
+    import subprocess
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import em'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        parts = line.split('|')
+        if len(parts) != 3 or not parts[0].startswith('import time:'):
+            continue
+        try:
+            cumulative = int(parts[1])
+        except ValueError:
+            continue
+        rows.append((cumulative, parts[2].rstrip()))
+
+    total = next((us for us, name in rows if name.strip() == 'em'), None)
+    if total is None:
+        print(f"import time: could not import em ({proc.stderr.strip().splitlines()[-1:]})")
+        return
+    print(f"import time: em {total / 1000:.0f} ms")
+    # Nesting shows as two extra spaces per level; em's own imports are level 1
+    direct = [(us, name.strip()) for us, name in rows if len(name) - len(name.lstrip()) == 3]
+    for us, name in sorted(direct, reverse=True)[:8]:
+        print(f"  {name:<32} {us / 1000:7.1f} ms")
+    deferred = [name for name in HEAVY_MODULES if any(n.strip() == name for _, n in rows)]
+    if deferred:
+        print(f"  imported eagerly (should be lazy): {', '.join(deferred)}")
+
+
+BENCHMARKS = {
+    'junk': bench_junk_classifier,
+    'body': bench_body_normalization,
+    'quotes': bench_quote_detection,
+    'importtime': bench_import_time,
+}
+
+
+def run_benchmarks(names):
+    names = names or list(BENCHMARKS)
+    failed = []
+    for name in names:
+        bench = BENCHMARKS.get(name)
+        if bench is None:
+            print(f"Unknown benchmark: {name} (available: {', '.join(BENCHMARKS)})")
+            return 1
+        if bench():
+            failed.append(name)
+    if failed:
+        print(f"Labelled corpus mismatches in: {', '.join(failed)}")
+        return 1
+    return 0
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        sys.exit(run_benchmarks(sys.argv[2:]))
+
+    # --daemon: stay resident after the window is closed (started by the face);
+    # --show: show the window right away instead of waiting for a SHOW message
+    daemon = "--daemon" in sys.argv[1:]
+    show = not daemon or "--show" in sys.argv[1:]
+
+    # The lock is held from here on and handed to the IPC receiver, so no
+    # second em.py can slip in between this check and binding the socket
+    lock_fd = None
+    socket_path = ipc_socket_path()
+    if socket_path:
+        try:
+            lock_fd = acquire_ipc_lock(socket_path)
+            held_elsewhere = lock_fd is None
+        except OSError:
+            # Unusable socket directory; IPCReceiver.start() reports it
+            held_elsewhere = False
+        if held_elsewhere:
+            # Another em.py already owns the socket; bring its window up instead
+            print("em.py is already running; showing it")
+            sys.exit(0 if send_to_running_instance("SHOW") else 1)
+
     app = QApplication(sys.argv)
-    window = EmailReaderWindow()
-    window.show()
+    if daemon:
+        app.setQuitOnLastWindowClosed(False)
+    window = EmailReaderWindow(daemon=daemon, ipc_lock_fd=lock_fd)
+    if daemon and not window.daemon:
+        # IPC failed to start; run as a plain window, or not at all if nobody would see it
+        if not show:
+            sys.exit(1)
+        app.setQuitOnLastWindowClosed(True)
+    if show:
+        window.show()
     sys.exit(app.exec())
 
 
@@ -3,8 +3,8 @@ import os
 if os.environ.get("XDG_SESSION_TYPE", "").lower() == "wayland":
     os.environ["QT_QPA_PLATFORM"] = "xcb"
 
-import sys, time, platform, random, signal, socket, subprocess, json, pathlib
-from PySide6.QtCore import Qt, QTimer, QPointF, QRect, QSize
+import sys, time, platform, random, signal, socket, subprocess, json, pathlib, collections, struct
+from PySide6.QtCore import Qt, QTimer, QPointF, QRect, QSize, QObject, QSocketNotifier, Signal
 from PySide6.QtGui import (
     QGuiApplication, QPainter, QBrush, QPen, QColor, QScreen, QFont,
     QKeyEvent, QMouseEvent, QPixmap, QIcon
@@ -23,6 +23,7 @@ BLINK_OPEN_SEC  = 1  # time to open eyes
 
 
 BLINK_DURATION_SEC = 1
+FRAME_INTERVAL_MS = 1000 // 60   # while the eyes are closing/opening
 LINE_W = 3
 FACE_COLOR   = QColor("#FDFD96")
 SCLERA_COLOR = QColor("white")
@@ -53,35 +54,80 @@ INPUT_SHIFT_PX     = 0
 
 WINDOW_SIDE_PADDING = 16
 
+BADGE_COLOR      = QColor("#E53935")
+BADGE_TEXT_COLOR = QColor("white")
+BADGE_SIZE_R     = 0.34   # badge diameter relative to the face radius
+
 FACE_OPACITY_NORMAL = 1.0
 FACE_OPACITY_HIDDEN = 0.35
 
 EMAIL_APP_PATH = "em.py"
 
 STATE_FILE = pathlib.Path.home() / ".photon_face_state.json"
+STATE_SAVE_DELAY_MS = 500
 
 IDLE_TIMEOUT_SEC = 30
 
+SUBMIT_PLACEHOLDER = "type then press Enter"
+REPLY_PLACEHOLDER = "Type reply and press Enter"
 
-def save_state(email_ever_opened: bool, position: tuple):
-    try:
-        state = {
-            "email_ever_opened": email_ever_opened,
-            "position": position
-        }
-        STATE_FILE.write_text(json.dumps(state))
-    except:
-        pass
+# Start em.py hidden shortly after the face so mail is fetched and summarized
+# before the first open; set PHOTON_EMAIL_PREFETCH=0 to start it on demand
+EMAIL_PREFETCH = os.environ.get("PHOTON_EMAIL_PREFETCH", "1") != "0"
+EMAIL_PREFETCH_DELAY_MS = 3000
 
 
-def load_state():
-    try:
-        if STATE_FILE.exists():
-            state = json.loads(STATE_FILE.read_text())
-            return state.get("email_ever_opened", False), state.get("position", None)
-    except:
-        pass
-    return False, None
+# ---------- Persistent state ----------
+class FaceStateStore(QObject):
+    """
+    In-memory face state backed by STATE_FILE.
+
+    update() only marks the state dirty; bursts of changes are coalesced into
+    one write after STATE_SAVE_DELAY_MS. Writes go to a temp file that is renamed
+    over STATE_FILE, so a crash mid-write never leaves a truncated file behind.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        super().__init__()
+        self.path = path
+        self.state = self._read()
+        self.dirty = False
+        self.writes = 0
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.flush)
+
+    def _read(self) -> dict:
+        try:
+            state = json.loads(self.path.read_text())
+            return state if isinstance(state, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key, default=None):
+        return self.state.get(key, default)
+
+    def update(self, **values):
+        changed = {k: v for k, v in values.items() if self.state.get(k) != v}
+        if not changed:
+            return
+        self.state.update(changed)
+        self.dirty = True
+        self._save_timer.start(STATE_SAVE_DELAY_MS)
+
+    def flush(self):
+        self._save_timer.stop()
+        if not self.dirty:
+            return
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps(self.state))
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+            self.writes += 1
+        except OSError as e:
+            print(f"[face] State save failed: {e}")
 
 
 # ---------- IPC (STRICT) ----------
@@ -107,28 +153,354 @@ def _ensure_ipc_parsed():
         _IPC_KIND, _IPC_ADDR = _parse_ipc_env()
 
 
-def send_ipc(msg: str):
-    try:
+# Framing must match em.py: 5-byte header (version, payload length) + JSON
+# {"id", "type", "body", "reply_to"}. em.py ACKs every request and follows
+# up long-running ones with a typed response (REPLY_SENT, DRAFT_READY, ...).
+IPC_PROTOCOL_VERSION = 1
+IPC_FRAME_HEADER = struct.Struct("!BI")
+IPC_MAX_PAYLOAD = 1024 * 1024
+
+IPC_QUEUE_MAX = 64          # messages held while em.py isn't listening
+IPC_OUTBUF_MAX = 256 * 1024 # bytes handed to a stalled em.py before new sends wait in the queue
+IPC_PENDING_MAX = 256       # requests still waiting for a typed response
+IPC_RETRY_MIN_MS = 250
+IPC_RETRY_MAX_MS = 5000
+# Pure UI state; stale by the time a receiver comes back, so never queued
+IPC_TRANSIENT_TYPES = ("TYPING",)
+# Responses that end a request (everything except ACK)
+IPC_FINAL_TYPES = ("REPLY_SENT", "REPLY_FAILED", "DRAFT_READY", "DRAFT_FAILED", "ERROR")
+
+
+# encode_ipc_frame and IPCFrameDecoder are duplicated in em.py (IPC protocol
+# section); any protocol change has to be made in both copies.
+def encode_ipc_frame(msg: dict) -> bytes:
+    payload = json.dumps(msg, separators=(",", ":")).encode("utf-8")
+    return IPC_FRAME_HEADER.pack(IPC_PROTOCOL_VERSION, len(payload)) + payload
+
+
+class IPCFrameDecoder:
+    """Reassembles frames from a byte stream; raises ValueError on a bad frame."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def feed(self, data: bytes) -> list:
+        self.buffer += data
+        messages = []
+        while len(self.buffer) >= IPC_FRAME_HEADER.size:
+            version, length = IPC_FRAME_HEADER.unpack_from(self.buffer)
+            if version != IPC_PROTOCOL_VERSION:
+                raise ValueError(f"unsupported protocol version {version}")
+            if length > IPC_MAX_PAYLOAD:
+                raise ValueError(f"frame too large ({length} bytes)")
+            end = IPC_FRAME_HEADER.size + length
+            if len(self.buffer) < end:
+                break
+            msg = json.loads(bytes(self.buffer[IPC_FRAME_HEADER.size:end]).decode("utf-8"))
+            del self.buffer[:end]
+            if not isinstance(msg, dict) or not isinstance(msg.get("type"), str):
+                raise ValueError("malformed message")
+            messages.append(msg)
+        return messages
+
+
+class IPCClient(QObject):
+    """Persistent stream connection to em.py.
+
+    Requests get an id; em.py's ACK and typed responses come back on the same
+    connection and are routed to the request's callback. Unsolicited events
+    (reply_to None) are emitted as event_received. While em.py isn't
+    listening, requests wait in a bounded queue and are flushed on reconnect.
+    The socket is non-blocking: frames go to an output buffer that a write
+    notifier drains, so a stalled em.py never blocks the GUI thread.
+    """
+    event_received = Signal(str, str)  # type, body
+
+    def __init__(self):
+        super().__init__()
+        self.sock = None
+        self.notifier = None
+        self.write_notifier = None
+        self.outbuf = bytearray()
+        self.decoder = None
+        self.queue = collections.deque(maxlen=IPC_QUEUE_MAX)
+        self.pending = {}           # request id -> callback(msg)
+        self.next_id = 1
+        self.sent = 0
+        self.dropped = 0
+        self.reconnects = 0
+        self._ever_connected = False
+        self._retry_ms = IPC_RETRY_MIN_MS
+        self._retry_pending = False
+        self.want_connection = False   # keep reconnecting even with nothing queued
+
+    def _connect(self):
         _ensure_ipc_parsed()
-        if _IPC_KIND == "unix":
-            s = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
-            s.connect(_IPC_ADDR)
-            s.send(msg.encode("utf-8"))
-            s.close()
-        elif _IPC_KIND == "udp":
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.sendto(msg.encode("utf-8"), _IPC_ADDR)
+        if _IPC_KIND != "unix":
+            return False
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            s.setblocking(False)
+            s.connect(_IPC_ADDR)   # EAGAIN (backlog full) counts as not listening yet
+        except OSError:
             s.close()
-    except:
+            return False
+        if self._ever_connected:
+            self.reconnects += 1
+        self._ever_connected = True
+        self.sock = s
+        self.decoder = IPCFrameDecoder()
+        self.notifier = QSocketNotifier(s.fileno(), QSocketNotifier.Read, self)
+        self.notifier.activated.connect(self._on_readable)
+        self.write_notifier = QSocketNotifier(s.fileno(), QSocketNotifier.Write, self)
+        self.write_notifier.setEnabled(False)
+        self.write_notifier.activated.connect(self._on_writable)
+        return True
+
+    def _disconnect(self):
+        for notifier in (self.notifier, self.write_notifier):
+            if notifier is not None:
+                notifier.setEnabled(False)
+                notifier.deleteLater()
+        self.notifier = None
+        self.write_notifier = None
+        self.outbuf.clear()
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+
+    def ensure_connected(self):
+        """Connect now, or keep retrying with backoff until em.py is listening."""
+        self.want_connection = True
+        if self.sock is None and not self._connect():
+            self._schedule_retry()
+
+    def _on_readable(self, *_):
+        try:
+            data = self.sock.recv(65536)
+            if not data:
+                self._disconnect()
+                return
+            messages = self.decoder.feed(data)
+        except BlockingIOError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"[face] IPC receive error: {e}")
+            self._disconnect()
+            return
+        for msg in messages:
+            self._dispatch(msg)
+
+    def _dispatch(self, msg: dict):
+        reply_to = msg.get("reply_to")
+        if reply_to is None:
+            self.event_received.emit(msg["type"], str(msg.get("body", "")))
+            return
+        if msg["type"] in IPC_FINAL_TYPES:
+            callback = self.pending.pop(reply_to, None)
+        else:
+            callback = self.pending.get(reply_to)
+        if callback is not None:
+            try:
+                callback(msg)
+            except Exception as e:
+                print(f"[face] IPC callback error: {e}")
+
+    def _send_now(self, data: bytes) -> bool:
+        if self.sock is None and not self._connect():
+            return False
+        if len(self.outbuf) >= IPC_OUTBUF_MAX:
+            # em.py isn't reading; leave it queued until the buffer drains
+            return False
+        self.outbuf += data
+        self._write()
+        if self.sock is None:
+            # Receiver gone or restarted; reconnect on the next attempt
+            return False
+        self.sent += 1
+        return True
+
+    def _write(self):
+        """Send as much of outbuf as the socket takes without blocking."""
+        try:
+            while self.outbuf:
+                del self.outbuf[:self.sock.send(self.outbuf)]
+        except BlockingIOError:
+            pass
+        except OSError:
+            self._disconnect()
+            return
+        self.write_notifier.setEnabled(bool(self.outbuf))
+
+    def _on_writable(self, *_):
+        if self.sock is None:
+            return
+        self._write()
+        if self.sock is not None and not self.outbuf and self.queue:
+            self.flush()
+
+    def send(self, msg_type: str, body: str = "", on_response=None) -> int:
+        msg_id = self.next_id
+        self.next_id += 1
+        if on_response is not None:
+            if len(self.pending) >= IPC_PENDING_MAX:
+                self.pending.pop(next(iter(self.pending)))
+            self.pending[msg_id] = on_response
+
+        data = encode_ipc_frame({"id": msg_id, "type": msg_type, "body": body, "reply_to": None})
+        if not self.queue and self._send_now(data):
+            return msg_id
+        if msg_type in IPC_TRANSIENT_TYPES:
+            self.dropped += 1
+            return msg_id
+        if len(self.queue) == self.queue.maxlen:
+            self.dropped += 1
+        self.queue.append(data)
+        self.flush()
+        return msg_id
+
+    def flush(self):
+        self._retry_pending = False
+        while self.queue:
+            if not self._send_now(self.queue[0]):
+                if self.sock is None:
+                    self._schedule_retry()
+                # else: outbuf is full; _on_writable flushes once em.py reads again
+                return
+            self.queue.popleft()
+        if self.want_connection and self.sock is None and not self._connect():
+            self._schedule_retry()
+            return
+        self._retry_ms = IPC_RETRY_MIN_MS
+
+    def _schedule_retry(self):
+        if self._retry_pending:
+            return
+        self._retry_pending = True
+        QTimer.singleShot(self._retry_ms, self.flush)
+        self._retry_ms = min(self._retry_ms * 2, IPC_RETRY_MAX_MS)
+
+    def stats(self) -> str:
+        return (f"sent {self.sent}, dropped {self.dropped}, "
+                f"queued {len(self.queue)}, reconnects {self.reconnects}")
+
+
+IPC_CLIENT = IPCClient()
+STATE_STORE = FaceStateStore(STATE_FILE)
+
+
+def send_ipc(msg: str, on_response=None):
+    """Send "TYPE\tbody" to em.py; on_response(msg) gets its ACK and typed response."""
+    try:
+        msg_type, _, body = msg.partition("\t")
+        return IPC_CLIENT.send(msg_type, body, on_response)
+    except Exception as e:
+        print(f"[face] IPC send error: {e}")
+
+
+def ipc_progress_placeholder(line_edit, default_text):
+    """on_response callback that shows a request's progress in a line edit's placeholder."""
+    labels = {
+        "ACK": "Sending…",
+        "REPLY_SENT": "Reply sent ✓",
+        "DRAFT_READY": "Draft ready ✓",
+    }
+
+    def on_response(msg):
+        msg_type = msg["type"]
+        text = labels.get(msg_type) or f"Failed: {msg.get('body') or msg_type}"
+        try:
+            line_edit.setPlaceholderText(text)
+        except RuntimeError:
+            return  # widget already deleted
+        if msg_type in IPC_FINAL_TYPES:
+            QTimer.singleShot(4000, lambda: _restore_placeholder(line_edit, default_text))
+
+    return on_response
+
+
+def _restore_placeholder(line_edit, text):
+    try:
+        line_edit.setPlaceholderText(text)
+    except RuntimeError:
         pass
 
 
+# ---------- Child exit / signal wakeups ----------
+_SIGCHLD_WATCHERS = set()
+
+
+class ProcessExitWatcher(QObject):
+    """Emits exited when a child process ends, without polling.
+
+    Uses a pidfd (readable once the process exits) where the kernel and Python
+    support it, otherwise SIGCHLD. SIGCHLD also fires for other children
+    (install.py), so treat exited as "check now", not proof of exit.
+    """
+    exited = Signal()
+
+    def __init__(self, pid, parent=None):
+        super().__init__(parent)
+        self.pidfd = None
+        self.notifier = None
+        try:
+            self.pidfd = os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            _SIGCHLD_WATCHERS.add(self)
+            return
+        self.notifier = QSocketNotifier(self.pidfd, QSocketNotifier.Read, self)
+        self.notifier.activated.connect(lambda *_: self.exited.emit())
+
+    def close(self):
+        _SIGCHLD_WATCHERS.discard(self)
+        if self.notifier is not None:
+            self.notifier.setEnabled(False)
+            self.notifier = None
+        if self.pidfd is not None:
+            os.close(self.pidfd)
+            self.pidfd = None
+
+
+def _on_sigchld(*_):
+    for watcher in list(_SIGCHLD_WATCHERS):
+        watcher.exited.emit()
+
+
+def install_signal_wakeup(app):
+    """Run Python signal handlers promptly while Qt's event loop is idle.
+
+    Python only runs handlers between bytecodes; with no timers firing the
+    interpreter can sit inside app.exec() indefinitely. The wakeup fd makes
+    each signal readable on a socket, and draining it from a QSocketNotifier
+    slot gives the interpreter its chance to run them.
+    """
+    r, w = socket.socketpair()
+    r.setblocking(False)
+    w.setblocking(False)
+    signal.set_wakeup_fd(w.fileno())
+
+    def drain(*_):
+        try:
+            while r.recv(64):
+                pass
+        except BlockingIOError:
+            pass
+
+    notifier = QSocketNotifier(r.fileno(), QSocketNotifier.Read, app)
+    notifier.activated.connect(drain)
+    app._signal_wakeup = (r, w, notifier)   # keep the sockets alive with the app
+    signal.signal(signal.SIGCHLD, _on_sigchld)
+
+
 # ---------- Right-aligned input behavior ----------
 class SubmitLine(QLineEdit):
     def __init__(self, *a, **kw):
         super().__init__(*a, **kw)
         self.setFocusPolicy(Qt.StrongFocus)
-        self.setPlaceholderText("type then press Enter")
+        self.setPlaceholderText(SUBMIT_PLACEHOLDER)
 
         self.setLayoutDirection(Qt.LeftToRight)
         self.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
@@ -223,9 +595,9 @@ class SubmitLine(QLineEdit):
                 try:
                     # Get the directory where face.py is located
                     script_dir = os.path.dirname(os.path.abspath(__file__))
-                    install_script = os.path.join(script_dir, "install.py")
+                    # Run as a module so the app catalog loads from cached bytecode
                     subprocess.Popen(
-                        ["python3", install_script, app_name],
+                        ["python3", "-m", "install", app_name],
                         cwd=script_dir,
                         stdout=subprocess.DEVNULL,
                         stderr=subprocess.DEVNULL
@@ -237,7 +609,7 @@ class SubmitLine(QLineEdit):
                 return
 
         if text:
-            send_ipc(f"SUBMIT\t{text}")
+            send_ipc(f"SUBMIT\t{text}", ipc_progress_placeholder(self, SUBMIT_PLACEHOLDER))
             self.clear()
         self.clearFocus()
     def mousePressEvent(self, e: QMouseEvent):
@@ -319,7 +691,7 @@ class SimpleEmailInput(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
 
         self.input_box = QLineEdit()
-        self.input_box.setPlaceholderText("Type reply and press Enter")
+        self.input_box.setPlaceholderText(REPLY_PLACEHOLDER)
         self.input_box.setFocusPolicy(Qt.StrongFocus)
 
         self.input_box.setStyleSheet("""
@@ -346,7 +718,7 @@ class SimpleEmailInput(QWidget):
     def on_submit(self):
         text = self.input_box.text().strip()
         if text:
-            send_ipc(f"SUBMIT\t{text}")
+            send_ipc(f"SUBMIT\t{text}", ipc_progress_placeholder(self.input_box, REPLY_PLACEHOLDER))
             self.input_box.clear()
 
     def mousePressEvent(self, event):
@@ -372,10 +744,10 @@ class FaceOverlay(QWidget):
         # state vars
         self.move(9999, 50)
         self.email_app_process = None
+        self.email_exit_watcher = None
         self.email_app_open = False
 
-        saved_email_ever_opened, saved_position = load_state()
-        self.email_ever_opened = saved_email_ever_opened
+        self.email_ever_opened = STATE_STORE.get("email_ever_opened", False)
 
         self.email_input_window = None
         self.button_window = None
@@ -387,21 +759,34 @@ class FaceOverlay(QWidget):
         self.idle_timeout_sec = IDLE_TIMEOUT_SEC
         self.last_interaction_time = time.perf_counter()
 
-        self.idle_check_timer = QTimer(self)
-        self.idle_check_timer.timeout.connect(self._check_idle)
-        self.idle_check_timer.start(1000)
+        # Single-shot, re-armed by every interaction; no wakeups while idle
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.timeout.connect(self._check_idle)
+        self.idle_timer.start(self.idle_timeout_sec * 1000)
 
         self.original_pos = None
         self.original_y = None
-        self.saved_email_position = saved_position
+        self.saved_email_position = STATE_STORE.get("position")
 
         t0 = time.perf_counter()
         self._last_blink_reset = t0
         self._next_blink_period = self._new_blink_period()
 
+        # Frames are only scheduled while a blink is animating (see _schedule_frames)
         self._frame_timer = QTimer(self)
+        self._frame_timer.setTimerType(Qt.PreciseTimer)
         self._frame_timer.timeout.connect(self._tick_frame)
-        self._frame_timer.start(1000 // 60)
+        self._phase_timer = QTimer(self)
+        self._phase_timer.setSingleShot(True)
+        self._phase_timer.timeout.connect(self._on_blink_phase)
+        self.paint_count = 0
+        self.face_cache_builds = 0
+        self._face_cache_key = None
+        self._face_base = None
+        self._face_badge = None
+        self.frame_ticks = 0
+        self._stats_started = t0
 
         if REPIN_EVERY_MS > 0:
             self._repin_timer = QTimer(self)
@@ -419,9 +804,13 @@ class FaceOverlay(QWidget):
         self._resize_to_screen()
         self._initial_position()
 
-        self.email_check_timer = QTimer(self)
-        self.email_check_timer.timeout.connect(self._check_email_app_status)
-        self.email_check_timer.start(1000)
+        # Pushed by em.py over IPC; no polling of the email process
+        self.unread_count = 0
+        self.sync_state = "idle"
+        IPC_CLIENT.event_received.connect(self._on_ipc_message)
+
+        if EMAIL_PREFETCH:
+            QTimer.singleShot(EMAIL_PREFETCH_DELAY_MS, self._prefetch_email)
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -467,6 +856,7 @@ class FaceOverlay(QWidget):
 
     def _mark_interaction(self):
         self.last_interaction_time = time.perf_counter()
+        self.idle_timer.start(self.idle_timeout_sec * 1000)
 
         if self.is_sleeping:
             self.is_sleeping = False
@@ -477,7 +867,11 @@ class FaceOverlay(QWidget):
             return
 
         elapsed = time.perf_counter() - self.last_interaction_time
-        if elapsed >= self.idle_timeout_sec and not self.is_sleeping:
+        if elapsed < self.idle_timeout_sec:
+            # last_interaction_time was bumped without re-arming; wait out the rest
+            self.idle_timer.start(int((self.idle_timeout_sec - elapsed) * 1000) + 1)
+            return
+        if not self.is_sleeping:
             self.is_sleeping = True
             self._set_opacity(FACE_OPACITY_HIDDEN)
 
@@ -504,10 +898,44 @@ class FaceOverlay(QWidget):
         except:
             pass
 
+    def _email_daemon_running(self):
+        return self.email_app_process is not None and self.email_app_process.poll() is None
+
+    def _start_email_daemon(self, show_at=None):
+        env = os.environ.copy()
+        env["PHOTON_IPC"] = os.environ.get("PHOTON_IPC", "")
+        args = ["python3", EMAIL_APP_PATH, "--daemon"]
+        if show_at is not None:
+            env["EM_WINDOW_X"] = str(show_at[0])
+            env["EM_WINDOW_Y"] = str(show_at[1])
+            args.append("--show")
+
+        self.email_app_process = subprocess.Popen(
+            args,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        # Hold a connection open so em.py can push events (HIDDEN, ...) to us
+        IPC_CLIENT.ensure_connected()
+
+        if self.email_exit_watcher is not None:
+            self.email_exit_watcher.close()
+        self.email_exit_watcher = ProcessExitWatcher(self.email_app_process.pid, self)
+        self.email_exit_watcher.exited.connect(self._check_email_app_status)
+
+    def _prefetch_email(self):
+        if self.email_app_open or self._email_daemon_running():
+            return
+        try:
+            self._start_email_daemon()
+        except Exception as e:
+            print(f"[face] Email prefetch failed to start: {e}")
+
     def _open_email_app(self):
         self._mark_interaction()
 
-        if self.email_app_process is None or self.email_app_process.poll() is not None:
+        if not self.email_app_open:
             try:
                 if self._repin_timer:
                     self._repin_timer.stop()
@@ -558,23 +986,16 @@ class FaceOverlay(QWidget):
                 self._create_email_input_window(input_x, input_y, input_w, input_h)
                 self._create_button_window(button_x, button_y)
 
-                env = os.environ.copy()
-                env["EM_WINDOW_X"] = str(email_x)
-                env["EM_WINDOW_Y"] = str(email_y)
-                env["PHOTON_IPC"] = os.environ.get("PHOTON_IPC", "")
-
-                self.email_app_process = subprocess.Popen(
-                    ["python3", EMAIL_APP_PATH],
-                    env=env,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
+                if self._email_daemon_running():
+                    # em.py is already warm (prefetched or opened before) - just show it
+                    send_ipc(f"SHOW\t{email_x},{email_y}")
+                else:
+                    self._start_email_daemon(show_at=(email_x, email_y))
 
                 self.email_app_open = True
                 self.email_ever_opened = True
 
-                current_pos = (self.x(), self.y())
-                save_state(self.email_ever_opened, current_pos)
+                STATE_STORE.update(email_ever_opened=self.email_ever_opened, position=[self.x(), self.y()])
 
                 self._set_opacity(FACE_OPACITY_NORMAL)
 
@@ -624,62 +1045,102 @@ class FaceOverlay(QWidget):
 
     def _check_email_app_status(self):
         try:
-            if self.email_app_process is not None:
-                poll_result = self.email_app_process.poll()
-
-                if poll_result is not None:
-                    self.email_app_open = False
-                    self.email_app_process = None
-
-                    if self.email_input_window:
-                        try: self.email_input_window.close()
-                        except: pass
-                        self.email_input_window = None
-
-                    if self.button_window:
-                        try: self.button_window.close()
-                        except: pass
-                        self.button_window = None
-
-                    # SHOW TEXTBOX + BUTTON AGAIN
-                    try:
-                        self.input.show()
-                        self.gmail_button.show()
-                    except:
-                        pass
-
-                    self.is_sleeping = True
-                    self._set_opacity(FACE_OPACITY_HIDDEN)
-
-                    s = self._current_screen()
-                    geo = s.availableGeometry() if s else None
-                    if geo:
-                        m = self._pixel_margin()
-                        w, h = self.width(), self.height()
-                        x = geo.x() + geo.width() - w - m
-                        y = geo.y() + m + 50
-                        x = max(geo.x(), min(x, geo.x() + geo.width() - w))
-                        y = max(geo.y(), min(y, geo.y() + geo.height() - h))
-
-                        self.move(x, y)
-                        self.setGeometry(x, y, w, h)
-                        self._update_layout()
-
-                    current_pos = (self.x(), self.y())
-                    save_state(self.email_ever_opened, current_pos)
-
-                    self.last_interaction_time = time.perf_counter()
-
-                else:
-                    if not self.email_app_open:
-                        self.email_app_open = True
-                        self._set_opacity(FACE_OPACITY_NORMAL)
-        except:import os
-
+            if self.email_app_process is not None and self.email_app_process.poll() is not None:
+                self.email_app_process = None
+                IPC_CLIENT.want_connection = False
+                if self.email_exit_watcher is not None:
+                    self.email_exit_watcher.close()
+                    self.email_exit_watcher = None
+                if self.unread_count:
+                    self.unread_count = 0
+                    self.update()
+                if self.email_app_open:
+                    self._on_email_window_closed()
+        except:
             self.email_app_open = False
             self.email_app_process = None
 
+    def _on_ipc_message(self, msg_type, content):
+        if msg_type == "HIDDEN":
+            if self.email_app_open:
+                self._on_email_window_closed()
+        elif msg_type == "UNREAD":
+            try:
+                count = max(0, int(content))
+            except ValueError:
+                return
+            if count != self.unread_count:
+                self.unread_count = count
+                self.update()
+        elif msg_type == "SYNC":
+            self.sync_state = content
+            tips = {"syncing": "Checking mail…", "error": "Couldn't reach Gmail"}
+            self.gmail_button.setToolTip(tips.get(content, ""))
+        elif msg_type in ("SENT", "SEND_FAILED"):
+            text = content if msg_type == "SENT" else f"Send failed: {content}"
+            if self.email_input_window:
+                target, default = self.email_input_window.input_box, REPLY_PLACEHOLDER
+            else:
+                target, default = self.input, SUBMIT_PLACEHOLDER
+            target.setPlaceholderText(text)
+            QTimer.singleShot(4000, lambda: _restore_placeholder(target, default))
+
+    def _on_email_window_closed(self):
+        """em.py's window went away (hidden or exited): put the face back in its corner."""
+        self.email_app_open = False
+
+        if self.email_input_window:
+            try: self.email_input_window.close()
+            except: pass
+            self.email_input_window = None
+
+        if self.button_window:
+            try: self.button_window.close()
+            except: pass
+            self.button_window = None
+
+        # SHOW TEXTBOX + BUTTON AGAIN
+        try:
+            self.input.show()
+            self.gmail_button.show()
+        except:
+            pass
+
+        self.is_sleeping = True
+        self._set_opacity(FACE_OPACITY_HIDDEN)
+
+        s = self._current_screen()
+        geo = s.availableGeometry() if s else None
+        if geo:
+            m = self._pixel_margin()
+            w, h = self.width(), self.height()
+            x = geo.x() + geo.width() - w - m
+            y = geo.y() + m + 50
+            x = max(geo.x(), min(x, geo.x() + geo.width() - w))
+            y = max(geo.y(), min(y, geo.y() + geo.height() - h))
+
+            self.move(x, y)
+            self.setGeometry(x, y, w, h)
+            self._update_layout()
+
+        STATE_STORE.update(email_ever_opened=self.email_ever_opened, position=[self.x(), self.y()])
+
+        self.last_interaction_time = time.perf_counter()
+
+    def shutdown_email_app(self):
+        """Stop the em.py daemon along with the face."""
+        if not self._email_daemon_running():
+            return
+        send_ipc("QUIT\t")
+        try:
+            self.email_app_process.wait(timeout=3)
+        except subprocess.TimeoutExpired:
+            self.email_app_process.terminate()
+
     def _set_opacity(self, opacity):
+        # Sleep/wake goes through here; it changes the eyes, so repaint and reschedule
+        self.update()
+        self._schedule_frames()
         self.setWindowOpacity(opacity)
         if hasattr(self, "input"):
             self.input.setWindowOpacity(opacity)
@@ -693,11 +1154,11 @@ class FaceOverlay(QWidget):
     def _new_blink_period(self) -> float:
         return random.uniform(9.0, 13.0)
 
-    def _eye_scale(self, t_now: float) -> float:
+    def _blink_state(self, t_now: float):
+        """(eye scale, animating?, seconds until the next blink phase) at t_now."""
         elapsed = t_now - self._last_blink_reset
 
         # Start a new blink cycle
-        total_blink_time = BLINK_CLOSE_SEC + BLINK_HOLD_SEC + BLINK_OPEN_SEC
         if elapsed > self._next_blink_period:
             self._last_blink_reset = t_now
             self._next_blink_period = self._new_blink_period()
@@ -706,24 +1167,56 @@ class FaceOverlay(QWidget):
         # --- PHASE 1: CLOSING ---
         if elapsed < BLINK_CLOSE_SEC:
             prog = elapsed / BLINK_CLOSE_SEC
-            return max(1.0 - prog, 0.0)  # Changed from 0.06
+            return max(1.0 - prog, 0.0), True, BLINK_CLOSE_SEC - elapsed
 
         # --- PHASE 2: HOLD CLOSED ---
         if elapsed < BLINK_CLOSE_SEC + BLINK_HOLD_SEC:
-            return 0.0  # Changed from 0.06
+            return 0.0, False, BLINK_CLOSE_SEC + BLINK_HOLD_SEC - elapsed
 
         # --- PHASE 3: OPENING ---
-        elapsed -= (BLINK_CLOSE_SEC + BLINK_HOLD_SEC)
-        if elapsed < BLINK_OPEN_SEC:
-            prog = elapsed / BLINK_OPEN_SEC
-            return max(prog, 0.0)  # Changed from 0.06
+        opening = elapsed - (BLINK_CLOSE_SEC + BLINK_HOLD_SEC)
+        if opening < BLINK_OPEN_SEC:
+            prog = opening / BLINK_OPEN_SEC
+            return max(prog, 0.0), True, BLINK_OPEN_SEC - opening
+
+        # --- OPEN until the next cycle ---
+        return 1.0, False, self._next_blink_period - elapsed
 
-        return 1.0
+    def _eye_scale(self, t_now: float) -> float:
+        return self._blink_state(t_now)[0]
 
+    def _schedule_frames(self):
+        """Run the frame timer only while the eyes move; otherwise sleep until the next phase."""
+        if self.is_sleeping or not self.isVisible():
+            self._frame_timer.stop()
+            self._phase_timer.stop()
+            return
 
+        _, animating, remaining = self._blink_state(time.perf_counter())
+        if animating:
+            self._phase_timer.stop()
+            if not self._frame_timer.isActive():
+                self._frame_timer.start(FRAME_INTERVAL_MS)
+        else:
+            self._frame_timer.stop()
+            self._phase_timer.start(int(remaining * 1000) + 1)
 
     def _tick_frame(self):
+        self.frame_ticks += 1
+        self.update()
+        if not self._blink_state(time.perf_counter())[1]:
+            # This frame lands on a static phase; park the timer
+            self._schedule_frames()
+
+    def _on_blink_phase(self):
         self.update()
+        self._schedule_frames()
+
+    def frame_stats(self) -> str:
+        elapsed = max(time.perf_counter() - self._stats_started, 1e-6)
+        return (f"painted {self.paint_count} frames in {elapsed:.0f}s "
+                f"({self.paint_count / elapsed:.2f}/s), {self.frame_ticks} animation ticks, "
+                f"{self.face_cache_builds} face cache builds")
 
     def _current_screen(self) -> QScreen:
         h = self.windowHandle()
@@ -746,6 +1239,7 @@ class FaceOverlay(QWidget):
         win_w = max(face_size, input_w + 2 * WINDOW_SIDE_PADDING)
         win_h = face_size + max(int(face_size * 0.52), 56) + 100  # Changed 75 to 100
         self.resize(win_w, win_h)
+        self._face_cache_key = None   # DPI/size changed; re-render the static layers
 
     def _layout_rects(self):
         w, h = self.width(), self.height()
@@ -792,16 +1286,86 @@ class FaceOverlay(QWidget):
         super().showEvent(e)
         self.raise_()
         self.activateWindow()
+        self._schedule_frames()
+
+    def _face_layers(self, w: int, h: int):
+        """Static face (circle, nose, mouth) and unread badge, pre-rendered once per size/DPI."""
+        dpr = self.devicePixelRatioF()
+        key = (w, h, dpr, self.unread_count)
+        if self._face_cache_key == key:
+            return self._face_base, self._face_badge
+
+        def layer():
+            pm = QPixmap(int(round(w * dpr)), int(round(h * dpr)))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.transparent)
+            return pm
+
+        size = min(w, h)
+        cx, cy = w / 2.0, h / 2.0
+        radius = size * 0.48
+
+        base = layer()
+        p = QPainter(base)
+        p.setRenderHint(QPainter.Antialiasing, True)
+
+        # Face
+        p.setBrush(QBrush(FACE_COLOR))
+        p.setPen(QPen(Qt.black, LINE_W))
+        p.drawEllipse(QPointF(cx, cy), radius, radius)
+
+        # Nose
+        nose_size = radius * NOSE_SIZE_R
+        p.setPen(Qt.NoPen)
+        p.setBrush(QBrush(NOSE_COLOR))
+        p.drawEllipse(QPointF(cx, cy), nose_size, nose_size)
+
+        # Mouth
+        mouth_w = radius * MOUTH_WIDTH_R
+        mouth_y = cy + radius * MOUTH_Y_OFFSET
+        p.setPen(QPen(MOUTH_COLOR, LINE_W))
+        p.drawLine(cx - mouth_w / 2, mouth_y, cx + mouth_w / 2, mouth_y)
+        p.end()
+
+        # Unread badge (count pushed by em.py); sits over the right eye, so it is its own layer
+        badge = None
+        if self.unread_count > 0:
+            badge = layer()
+            p = QPainter(badge)
+            p.setRenderHint(QPainter.Antialiasing, True)
+            badge_d = radius * BADGE_SIZE_R * 2
+            badge_rect = QRect(
+                int(cx + radius * 0.70 - badge_d / 2), int(cy - radius * 0.70 - badge_d / 2),
+                int(badge_d), int(badge_d)
+            )
+            p.setPen(QPen(Qt.white, max(1, LINE_W - 1)))
+            p.setBrush(QBrush(BADGE_COLOR))
+            p.drawEllipse(badge_rect)
+            f = QFont()
+            f.setBold(True)
+            f.setPixelSize(max(8, int(badge_d * 0.55)))
+            p.setFont(f)
+            p.setPen(BADGE_TEXT_COLOR)
+            p.drawText(badge_rect, Qt.AlignCenter, str(self.unread_count) if self.unread_count < 10 else "9+")
+            p.end()
+
+        self._face_cache_key = key
+        self._face_base, self._face_badge = base, badge
+        self.face_cache_builds += 1
+        return base, badge
 
     def paintEvent(self, event):
+        self.paint_count += 1
         face_rect, _, _ = self._layout_rects()
         w = face_rect.width()
         h = face_rect.height()
         t_now = time.perf_counter()
 
         blink_s = self._eye_scale(t_now) if not self.is_sleeping else 0.01
+        base, badge = self._face_layers(w, h)
 
         p = QPainter(self)
+        p.drawPixmap(face_rect.topLeft(), base)
         p.setRenderHint(QPainter.Antialiasing, True)
 
         size = min(w, h)
@@ -809,12 +1373,7 @@ class FaceOverlay(QWidget):
         cy = face_rect.y() + h / 2.0
         radius = size * 0.48
 
-        # Face
-        p.setBrush(QBrush(FACE_COLOR))
-        p.setPen(QPen(Qt.black, LINE_W))
-        p.drawEllipse(QPointF(cx, cy), radius, radius)
-
-        # Eyes
+        # Eyes (the only animated part)
         eye_y = cy - radius * EYE_H_OFFSET
         eye_dx = radius * EYE_X_OFFSET
         sclera_w = radius * SCLERA_W_R
@@ -839,16 +1398,8 @@ class FaceOverlay(QWidget):
             p.drawEllipse(QPointF(cx - eye_dx - offset, eye_y - offset), highlight_r, highlight_r)
             p.drawEllipse(QPointF(cx + eye_dx - offset, eye_y - offset), highlight_r, highlight_r)
 
-        # Nose
-        nose_size = radius * NOSE_SIZE_R
-        p.setBrush(QBrush(NOSE_COLOR))
-        p.drawEllipse(QPointF(cx, cy), nose_size, nose_size)
-
-        # Mouth
-        mouth_w = radius * MOUTH_WIDTH_R
-        mouth_y = cy + radius * MOUTH_Y_OFFSET
-        p.setPen(QPen(MOUTH_COLOR, LINE_W))
-        p.drawLine(cx - mouth_w / 2, mouth_y, cx + mouth_w / 2, mouth_y)
+        if badge is not None:
+            p.drawPixmap(face_rect.topLeft(), badge)
 
 
 def main():
@@ -860,8 +1411,13 @@ def main():
 
         signal.signal(signal.SIGINT, _quit)
         signal.signal(signal.SIGTERM, _quit)
+        install_signal_wakeup(app)
 
         w = FaceOverlay()
+        app.aboutToQuit.connect(w.shutdown_email_app)
+        app.aboutToQuit.connect(STATE_STORE.flush)
+        app.aboutToQuit.connect(lambda: print(f"[face] IPC: {IPC_CLIENT.stats()}"))
+        app.aboutToQuit.connect(lambda: print(f"[face] render: {w.frame_stats()}"))
         w.show()
 
         sys.exit(app.exec())
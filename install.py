@@ -7,6 +7,10 @@ Tries: Flatpak → Snap → APT (in order until one works)
 import sys
 import subprocess
 import os
+import re
+import time
+import json
+import shlex
 
 # ============================================================================
 # INSTALL COMMANDS - Each app has flatpak, snap, apt options
@@ -3091,49 +3095,244 @@ ALIASES = {
 }
 
 
+# ============================================================================
+# APP INDEX - Fuzzy lookup over INSTALL_COMMANDS + ALIASES
+# Names are compacted ("VS-Code" -> "vscode") and matched by trigram similarity,
+# so typos and partial names still find the right app
+# ============================================================================
+
+# Installing runs sudo, so a fuzzy match is only trusted when it is very close;
+# weaker ones are just listed and the name goes to apt unchanged
+AUTO_INSTALL_THRESHOLD = 0.85   # minimum similarity to install a fuzzy match
+SUGGEST_THRESHOLD = 0.55        # minimum similarity to list a match as a suggestion
+EDIT_MIN_CHARS = 5              # shorter queries ("ssh", "xed") must match without edits
+PREFIX_MIN_CHARS = 3        # partial names shorter than this never prefix-match
+RERANK_CANDIDATES = 12      # best trigram hits re-scored by edit distance
+
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9+]+')
+
+
+def _compact(name: str) -> str:
+    return _NON_ALNUM_RE.sub('', name.lower())
+
+
+def _trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance counting an adjacent swap ("discrod") as one edit."""
+    prev2, prev = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return prev[len(b)]
+
+
+class AppIndex:
+    """Every catalog name and alias, compacted and indexed by trigram."""
+
+    def __init__(self, commands: dict, aliases: dict):
+        self.exact = {}             # compact key -> canonical app
+        for app in commands:
+            self.exact.setdefault(_compact(app), app)
+        for alias, app in aliases.items():
+            if app in commands:
+                self.exact.setdefault(_compact(alias), app)
+
+        self.keys = list(self.exact)
+        self.key_grams = [_trigrams(k) for k in self.keys]
+        self.postings = {}          # trigram -> ids of keys containing it
+        for key_id, grams in enumerate(self.key_grams):
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(key_id)
+
+    def search(self, query: str, limit: int = 5):
+        """Ranked [(app, score)] for query, best first; score 1.0 is an exact hit."""
+        q = _compact(query)
+        if not q:
+            return []
+        if q in self.exact:
+            return [(self.exact[q], 1.0)]
+
+        q_grams = _trigrams(q)
+        shared = {}
+        for gram in q_grams:
+            for key_id in self.postings.get(gram, ()):
+                shared[key_id] = shared.get(key_id, 0) + 1
+
+        # Dice coefficient over trigrams picks the candidates...
+        dice = {
+            key_id: 2.0 * common / (len(q_grams) + len(self.key_grams[key_id]))
+            for key_id, common in shared.items()
+        }
+        candidates = sorted(dice, key=dice.get, reverse=True)[:RERANK_CANDIDATES]
+
+        best = {}
+        for key_id in candidates:
+            key = self.keys[key_id]
+            score = dice[key_id]
+            # ...and a small edit distance rescues typos trigrams punish hard (swaps)
+            if len(q) >= EDIT_MIN_CHARS and abs(len(q) - len(key)) <= max(1, len(q) // 4):
+                dist = _edit_distance(q, key)
+                if dist <= max(1, len(q) // 4):
+                    score = max(score, 1.0 - dist / max(len(q), len(key)))
+            if len(q) >= PREFIX_MIN_CHARS and key.startswith(q):
+                # Partial name ("obs stu", "thunder"): rank by how much of the key it covers
+                score = max(score, 0.6 + 0.4 * len(q) / len(key))
+            app = self.exact[key]
+            if score > best.get(app, 0.0):
+                best[app] = score
+
+        # A word of the query that is itself a catalog name ("vlc player")
+        for word in re.split(r'[^a-z0-9+]+', query.lower()):
+            app = self.exact.get(word)
+            if app and len(word) >= PREFIX_MIN_CHARS:
+                best[app] = max(best.get(app, 0.0), 0.6 + 0.4 * len(word) / len(q))
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
+
+    def resolve(self, query: str):
+        """Canonical app for query, or None unless it is an exact, alias or very close match."""
+        ranked = self.search(query, limit=2)
+        if not ranked or ranked[0][1] < AUTO_INSTALL_THRESHOLD:
+            return None
+        if ranked[0][1] < 1.0 and len(ranked) > 1 and ranked[1][1] >= AUTO_INSTALL_THRESHOLD:
+            return None   # ambiguous ("chrom": chrome or chromium?)
+        return ranked[0][0]
+
+    def suggestions(self, query: str, limit: int = 3):
+        return [app for app, score in self.search(query, limit) if score >= SUGGEST_THRESHOLD]
+
+
+_APP_INDEX = None
+
+
+def app_index() -> AppIndex:
+    global _APP_INDEX
+    if _APP_INDEX is None:
+        _APP_INDEX = AppIndex(INSTALL_COMMANDS, ALIASES)
+    return _APP_INDEX
+
+
 # ============================================================================
 # TERMINAL DETECTION
 # ============================================================================
 
-def find_terminal():
-    """Find terminal on HOST system"""
-    in_flatpak = os.path.exists("/app") or "FLATPAK_ID" in os.environ
-    terminals = ['gnome-terminal', 'konsole', 'xfce4-terminal', 'tilix', 'terminator', 'alacritty', 'kitty', 'xterm', 'x-terminal-emulator']
-    
-    for term in terminals:
-        try:
-            if in_flatpak:
-                result = subprocess.run(
-                    ['flatpak-spawn', '--host', 'which', term],
-                    capture_output=True,
-                    timeout=2,
-                    cwd="/"
-                )
-            else:
-                result = subprocess.run(
-                    ['which', term],
-                    capture_output=True,
-                    timeout=1,
-                    cwd="/"
-                )
-            
-            if result.returncode == 0:
-                return term
-                
-        except Exception:
-            continue
-    
-    return None
+TERMINALS = ['gnome-terminal', 'konsole', 'xfce4-terminal', 'tilix', 'terminator', 'alacritty', 'kitty', 'xterm', 'x-terminal-emulator']
+
+# The detected terminal is remembered between runs; re-probed when stale or when it fails to start
+TERMINAL_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".config", "photon", "terminal.json")
+TERMINAL_CACHE_TTL_SEC = 7 * 24 * 3600
+TERMINAL_PROBE_TIMEOUT_SEC = 3
+# Terminals that hand the window to a server and exit right away (gnome-terminal) or keep
+# running (xterm) both pass; a quick non-zero exit means the terminal could not start
+TERMINAL_START_CHECK_SEC = 0.3
+
+# One shell on the host checks every candidate: prints "<name> <path>" for the first found
+_PROBE_SCRIPT = 'for t in "$@"; do p=$(command -v "$t") && { echo "$t $p"; exit 0; }; done; exit 1'
+
+
+def in_flatpak():
+    return os.path.exists("/app") or "FLATPAK_ID" in os.environ
+
+
+def _probe_terminal(sandboxed: bool):
+    """(name, path) of the first installed terminal on the host, or None"""
+    cmd = ['sh', '-c', _PROBE_SCRIPT, 'sh'] + TERMINALS
+    if sandboxed:
+        cmd = ['flatpak-spawn', '--host'] + cmd
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=TERMINAL_PROBE_TIMEOUT_SEC,
+            cwd="/"
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    name, _, path = result.stdout.strip().partition(' ')
+    return (name, path) if name in TERMINALS else None
+
+
+def _load_terminal_cache(sandboxed: bool):
+    try:
+        with open(TERMINAL_CACHE_FILE) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("in_flatpak") != sandboxed:
+        return None
+    if time.time() - cached.get("checked_at", 0) > TERMINAL_CACHE_TTL_SEC:
+        return None
+    if cached.get("terminal") not in TERMINALS:
+        return None
+    # Outside the sandbox the host path is ours to check; inside it launch failures invalidate
+    if not sandboxed and not os.path.exists(cached.get("path") or ""):
+        return None
+    return cached["terminal"]
+
+
+def _save_terminal_cache(sandboxed: bool, terminal: str, path: str):
+    tmp_path = TERMINAL_CACHE_FILE + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(TERMINAL_CACHE_FILE), exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump({"terminal": terminal, "path": path, "in_flatpak": sandboxed,
+                       "checked_at": time.time()}, f)
+        os.replace(tmp_path, TERMINAL_CACHE_FILE)
+    except OSError as e:
+        print(f"[install] Terminal cache save failed: {e}")
+
+
+def invalidate_terminal_cache():
+    try:
+        os.unlink(TERMINAL_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def find_terminal(refresh: bool = False):
+    """Find terminal on HOST system -> (name or None, came from cache)"""
+    t0 = time.perf_counter()
+    sandboxed = in_flatpak()
+
+    terminal = None if refresh else _load_terminal_cache(sandboxed)
+    if terminal:
+        print(f"[install] Terminal: {terminal} (cached, {(time.perf_counter() - t0) * 1000:.1f} ms)")
+        return terminal, True
+
+    found = _probe_terminal(sandboxed)
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+    if not found:
+        invalidate_terminal_cache()
+        print(f"[install] Terminal probe found nothing ({elapsed_ms:.1f} ms)")
+        return None, False
+
+    terminal, path = found
+    _save_terminal_cache(sandboxed, terminal, path)
+    print(f"[install] Terminal: {terminal} (probed, {elapsed_ms:.1f} ms)")
+    return terminal, False
 
 
 # ============================================================================
 # LAUNCH INSTALL WITH FALLBACK
 # ============================================================================
 
-def launch_install(app_name: str, flatpak_cmd, snap_cmd, apt_cmd):
-    """Launch installation in terminal with fallback"""
+def launch_install(app_name: str, flatpak_cmd, snap_cmd, apt_cmd, note=None):
+    """Launch installation in terminal with fallback; note is shown above the output"""
     
-    terminal = find_terminal()
+    terminal, cached = find_terminal()
     if not terminal:
         print("[install] ✗ Terminal not found")
         return False
@@ -3181,6 +3380,7 @@ INSTALL_SUCCESS=0
 echo "========================================"
 echo "Installing {app_name}"
 echo "========================================"
+{f'echo {shlex.quote(note)}' if note else ''}
 echo ""
 {''.join(commands)}
 echo ""
@@ -3198,6 +3398,18 @@ echo "Press Enter to close..."
 read
 '''
     
+    if _open_terminal(terminal, script, app_name):
+        return True
+    if cached:
+        # The cached terminal is gone (uninstalled, or another host); probe again once
+        terminal, _ = find_terminal(refresh=True)
+        if terminal:
+            return _open_terminal(terminal, script, app_name)
+    return False
+
+
+def _open_terminal(terminal: str, script: str, app_name: str):
+    """Run script in terminal; False if the terminal could not be started"""
     # Build terminal command
     if terminal == 'gnome-terminal':
         cmd = ['gnome-terminal', '--', 'bash', '-c', script]
@@ -3219,16 +3431,23 @@ read
         cmd = [terminal, '-e', 'bash', '-c', script]
     
     try:
-        if os.path.exists("/app") or "FLATPAK_ID" in os.environ:
+        if in_flatpak():
             cmd = ['flatpak-spawn', '--host'] + cmd
         
-        subprocess.Popen(
+        proc = subprocess.Popen(
             cmd, 
             cwd="/",
             stdout=subprocess.DEVNULL, 
             stderr=subprocess.DEVNULL
         )
         
+        try:
+            if proc.wait(timeout=TERMINAL_START_CHECK_SEC) != 0:
+                print(f"[install] ✗ {terminal} exited with {proc.returncode}")
+                return False
+        except subprocess.TimeoutExpired:
+            pass
+        
         print(f"[install] ✓ Terminal opened for {app_name}")
         return True
         
@@ -3246,22 +3465,27 @@ def install_app(app_name: str):
     
     print(f"[install] Installing: {app_name}")
     
-    # Normalize the app name
-    app = app_name.lower().strip()
-    
-    # Check aliases first
-    app = ALIASES.get(app, app)
+    # Resolve aliases, typos and partial names against the catalog
+    app = app_index().resolve(app_name)
+    note = None
     
     # Get the install commands
-    if app in INSTALL_COMMANDS:
+    if app is not None:
+        if _compact(app) != _compact(app_name):
+            print(f"[install] Matched '{app_name}' -> {app}")
         flatpak_cmd, snap_cmd, apt_cmd = INSTALL_COMMANDS[app]
     else:
         # Unknown app - try apt only
+        app = app_name.lower().strip()
         flatpak_cmd = None
         snap_cmd = None
         apt_cmd = f"sudo apt update && sudo apt install -y {app}"
+        similar = app_index().suggestions(app_name)
+        if similar:
+            note = f"Not in the catalog; similar apps: {', '.join(similar)}"
+            print(f"[install] {note}")
     
-    return launch_install(app_name, flatpak_cmd, snap_cmd, apt_cmd)
+    return launch_install(app_name, flatpak_cmd, snap_cmd, apt_cmd, note)
 
 
 # ============================================================================
@@ -3275,8 +3499,29 @@ def main():
         print("  install.py chrome")
         print("  install.py vscode")
         print("  install.py discord")
+        print("  install.py --search <name>   (show ranked catalog matches)")
+        print("  install.py --terminal        (re-detect the terminal, then read it from the cache)")
         return 1
     
+    if sys.argv[1] == '--search':
+        query = ' '.join(sys.argv[2:])
+        t0 = time.perf_counter()
+        index = app_index()
+        t1 = time.perf_counter()
+        ranked = index.search(query)
+        t2 = time.perf_counter()
+        print(f"[install] index: {len(index.keys)} names built in {(t1 - t0) * 1000:.2f} ms; "
+              f"search: {(t2 - t1) * 1e6:.0f} µs")
+        for app, score in ranked:
+            marker = '*' if score >= AUTO_INSTALL_THRESHOLD else ' '
+            print(f"  {marker} {app:<24} {score:.2f}")
+        return 0
+    
+    if sys.argv[1] == '--terminal':
+        find_terminal(refresh=True)
+        terminal, _ = find_terminal()
+        return 0 if terminal else 1
+    
     app = ' '.join(sys.argv[1:])
     install_app(app)
     return 0